@@ -0,0 +1,129 @@
+# benchmarks/bench_pipelined.py
+
+"""
+Compares end-to-end throughput of the serial and pipelined pipeline modes.
+
+Generates raw CSV files (with some duplicates across files), runs
+run_pipeline on them once per mode and queue depth, and reports seconds,
+rows/s and the Ingest → Silver stage time.
+
+--read-latency-ms emulates remote storage (e.g. an object store) by delaying
+every raw file read. That wait is what the pipelined reader overlaps with
+cleaning; on local disk with a single core, the stages only share the CPU.
+
+    python benchmarks/bench_pipelined.py --files 20 --rows 100000 --depths 1 2 4
+    python benchmarks/bench_pipelined.py --files 20 --rows 50000 --read-latency-ms 100
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pipeline import run_pipeline  # noqa: E402
+
+SCHEMA = {"columns": {"id": {"type": "string"}, "name": {"type": "string"}}}
+
+
+def write_raw_files(raw_dir: Path, files: int, rows: int) -> None:
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(0)
+    previous = pd.DataFrame()
+    for i in range(files):
+        df = pd.DataFrame(
+            {
+                "id": rng.integers(0, 5_000, rows),
+                "name": rng.choice(["alice", "bob", "carol", "dave"], rows),
+                "date": (
+                    pd.Timestamp("2025-01-01")
+                    + pd.to_timedelta(rng.integers(0, 90, rows), unit="D")
+                ).strftime("%Y-%m-%d"),
+                "value": rng.normal(100, 15, rows).round(2),
+            }
+        )
+        if not previous.empty:
+            # Re-delivered rows from the previous file
+            df = pd.concat([df, previous.head(rows // 20)], ignore_index=True)
+        df.to_csv(raw_dir / f"part_{i:04d}.csv", index=False)
+        previous = df
+
+
+def add_read_latency(seconds: float) -> None:
+    """Makes every pd.read_csv call wait first, like a request to remote storage."""
+    read_csv = pd.read_csv
+
+    def delayed_read_csv(*args, **kwargs):
+        time.sleep(seconds)
+        return read_csv(*args, **kwargs)
+
+    pd.read_csv = delayed_read_csv
+
+
+def run_mode(root: Path, name: str, pipelined: dict) -> dict:
+    out = root / name
+    config = {
+        "input_path": str(root / "raw"),
+        "bronze_path": str(out / "bronze"),
+        "silver_path": str(out / "silver"),
+        "gold_path": str(out / "gold"),
+        "reports_path": str(out / "reports"),
+        "schema": SCHEMA,
+        "pipelined": pipelined,
+    }
+    return run_pipeline(config)
+
+
+def main(files: int, rows: int, depths, read_latency_ms: float = 0.0) -> None:
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_raw_files(root / "raw", files, rows)
+        if read_latency_ms:
+            add_read_latency(read_latency_ms / 1000)
+
+        runs = [("serial", {"enabled": False})]
+        runs += [
+            (f"pipelined d={d}", {"enabled": True, "read_ahead": d, "write_behind": d})
+            for d in depths
+        ]
+
+        print(
+            f"{'mode':<16} {'seconds':>8} {'rows/s':>10} {'speedup':>8} {'ingest→silver s':>16} {'silver rows':>12}"
+        )
+        baseline = None
+        for name, pipelined in runs:
+            summary = run_mode(root, name.replace(" ", "_"), pipelined)
+            stages = summary["stage_seconds"]
+            to_silver = stages.get(
+                "bronze_silver", stages.get("bronze", 0) + stages.get("silver", 0)
+            )
+            baseline = baseline or summary["seconds"]
+            print(
+                f"{name:<16} {summary['seconds']:>8.2f} {summary['rows_per_second']:>10.0f} "
+                f"{baseline / summary['seconds']:>7.2f}x {to_silver:>16.2f} {summary['rows']['silver']:>12}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pipelined vs serial pipeline execution")
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per raw file")
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[1, 2, 4], help="Queue depths to try"
+    )
+    parser.add_argument(
+        "--read-latency-ms",
+        type=float,
+        default=0.0,
+        help="Delay added to every raw file read, emulating remote storage",
+    )
+    args = parser.parse_args()
+    main(args.files, args.rows, args.depths, args.read_latency_ms)
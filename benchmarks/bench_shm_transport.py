@@ -0,0 +1,77 @@
+# benchmarks/bench_shm_transport.py
+
+"""
+Compares returning a DataFrame from a worker process by pickling vs. via shared memory.
+
+Each worker builds and caches the frames first, so the timings cover only the
+transfer: serialize in the worker, cross the process boundary, and materialize
+in the parent (as a zero-copy Arrow table, or as pandas).
+
+    python benchmarks/bench_shm_transport.py --rows 10000 100000 1000000 --repeat 3
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.shm_transport import open_frame, receive_frame, share_frame  # noqa: E402
+
+_frames = {}
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    # Silver-like columns: ids, names, numeric values and timestamps
+    if rows not in _frames:
+        rng = np.random.default_rng(rows)
+        _frames[rows] = pd.DataFrame({
+            "id": rng.integers(0, 10_000, rows).astype(str),
+            "name": rng.choice(["alice", "bob", "carol", "dave"], rows),
+            "value": rng.normal(100, 15, rows),
+            "date": pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+        })
+    return _frames[rows]
+
+
+def _pickled(rows: int) -> pd.DataFrame:
+    return _frame(rows)
+
+
+def _shared(rows: int):
+    return share_frame(_frame(rows))
+
+
+def _best(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(rows_list, repeat: int) -> None:
+    print(f"{'rows':>10} {'MB':>8} {'pickle':>10} {'shm table':>10} {'shm pandas':>11}")
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        for rows in rows_list:
+            # Build in the worker outside the timings
+            size_mb = pool.submit(_frame, rows).result().memory_usage(deep=True).sum() / 1e6
+
+            pickle_s = _best(lambda: pool.submit(_pickled, rows).result(), repeat)
+            table_s = _best(lambda: open_frame(pool.submit(_shared, rows).result()), repeat)
+            pandas_s = _best(lambda: receive_frame(pool.submit(_shared, rows).result()), repeat)
+            print(f"{rows:>10} {size_mb:>8.1f} {pickle_s:>9.3f}s {table_s:>9.3f}s {pandas_s:>10.3f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark shared-memory vs pickled DataFrame transfer")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
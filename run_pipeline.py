@@ -1,82 +1,81 @@
 import argparse
-import logging
+import os
 import sys
 from pathlib import Path
 
-from src.utils import setup_logging, load_config
-from src.ingestion import ingest_files
-from src.bronze_to_silver import clean_and_standardize
-from src.silver_to_gold import aggregate_and_enrich
-from src.visualization import generate_visualizations
+from src.utils import load_config, stop_logging, setup_logging
+from src.pipeline import run_pipeline, setup_pipeline_logging
+from src.multi_runner import expand_config_paths, format_summary, run_many
 
 
-def main(config_path: Path) -> None:
+def main(config_path: Path, pipelined: bool = False) -> None:
     # Load config
     config = load_config(str(config_path))
+    if pipelined:
+        config["pipelined"] = {**(config.get("pipelined") or {}), "enabled": True}
 
-    # Ensure logs directory exists
-    logs_dir = Path(config.get("logs_path", "logs"))
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    # Setup logging (queued: handlers run on a background listener thread)
+    setup_pipeline_logging(config)
 
-    # Setup logging
-    setup_logging(config.get("log_level", "INFO"))
+    summary = run_pipeline(config)
+    stop_logging()
 
-    logger = logging.getLogger(__name__)
-    logger.info("Starting Data Pipeline Execution")
-
-    # Ingest raw data → Bronze
-    logger.info("Starting ingestion to Bronze layer")
-    bronze_df = ingest_files(
-        config["input_path"],
-        config["bronze_path"],
-        config.get("schema", {})
-    )
-
-    if bronze_df.empty:
-        logger.warning("No data ingested. Exiting pipeline.")
+    if summary["status"] == "no_data":
         sys.exit(1)
 
-    bronze_path = Path(config["bronze_path"])
-    bronze_path.mkdir(parents=True, exist_ok=True)
-    bronze_file = bronze_path / "bronze_data.parquet"
-    bronze_df.to_parquet(bronze_file, index=False)
-    logger.info(f"Bronze data saved to {bronze_file}")
-
-    # Bronze → Silver transformation
-    logger.info("Starting Bronze to Silver transformation")
-    silver_df = clean_and_standardize(bronze_df)
-    silver_path = Path(config["silver_path"])
-    silver_path.mkdir(parents=True, exist_ok=True)
-    silver_file = silver_path / "silver_data.parquet"
-    silver_df.to_parquet(silver_file, index=False)
-    logger.info(f"Silver data saved to {silver_file}")
 
-    # Silver → Gold transformation
-    logger.info("Starting Silver to Gold transformation")
-    gold_df = aggregate_and_enrich(silver_df)
-    gold_path = Path(config["gold_path"])
-    gold_path.mkdir(parents=True, exist_ok=True)
-    gold_file = gold_path / "gold_data.parquet"
-    gold_df.to_parquet(gold_file, index=False)
-    logger.info(f"Gold data saved to {gold_file}")
+def main_many(
+    config_patterns: list,
+    max_workers: int = None,
+    memory_limit_mb: int = None,
+    summary_path: str = None,
+) -> None:
+    # Runner-level logging only; each dataset logs to its own logs_path
+    setup_logging()
+    summary = run_many(config_patterns, max_workers, memory_limit_mb, summary_path)
+    stop_logging()
 
-    # Generate visualizations
-    logger.info("Generating visualizations")
-    reports_path = Path(config.get("reports_path", "reports/"))
-    reports_path.mkdir(parents=True, exist_ok=True)
-    generate_visualizations(gold_df, output_dir=reports_path)
-    logger.info("Visualizations generated and saved")
-
-    logger.info("Data Pipeline Execution completed successfully")
+    print(format_summary(summary))
+    if summary["failed"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run full data pipeline")
     parser.add_argument(
         "--config",
-        type=Path,
+        nargs="+",
         required=True,
-        help="Path to pipeline YAML configuration file"
+        help="Path to pipeline YAML configuration file. Several paths or globs "
+             "(e.g. 'configs/tenants/*.yaml') run the datasets on a shared worker pool"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Maximum datasets processed concurrently (multi-config runs)"
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=None,
+        help="Address-space limit per worker process in MB (multi-config runs)"
+    )
+    parser.add_argument(
+        "--summary",
+        default=None,
+        help="Path to write the combined JSON run summary (multi-config runs)"
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Overlap reading, cleaning and writing of raw files (single-config runs; "
+             "queue depths come from the config's 'pipelined' block)"
     )
     args = parser.parse_args()
-    main(args.config)
+
+    config_paths = expand_config_paths(args.config)
+    if len(config_paths) == 1:
+        main(Path(config_paths[0]), args.pipelined)
+    else:
+        main_many(config_paths, args.max_workers, args.memory_limit_mb, args.summary)
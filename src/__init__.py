@@ -4,6 +4,7 @@ from .ingestion import ingest_files, validate_schema
 from .bronze_to_silver import clean_bronze_to_silver
 from .silver_to_gold import aggregate_and_enrich
 from .visualization import generate_visualizations
+from .profiling import DataProfile, profile_dataframe
 
 __all__ = [
     "ingest_files",
@@ -11,6 +12,8 @@ __all__ = [
     "clean_bronze_to_silver",
     "aggregate_and_enrich",
     "generate_visualizations",
+    "DataProfile",
+    "profile_dataframe",
 ]
 
 
@@ -28,12 +28,12 @@ def clean_and_standardize(bronze_df: pd.DataFrame) -> pd.DataFrame:
     before_count = len(bronze_df)
     df = bronze_df.drop_duplicates()
     after_dedup = len(df)
-    logger.info(f"Dropped {before_count - after_dedup} duplicate records.")
+    logger.info("Dropped %s duplicate records.", before_count - after_dedup)
 
     # Drop rows missing critical columns
     df = df.dropna(subset=['id', 'name'])
     after_dropna = len(df)
-    logger.info(f"Removed {after_dedup - after_dropna} rows with missing 'id' or 'name'.")
+    logger.info("Removed %s rows with missing 'id' or 'name'.", after_dedup - after_dropna)
 
     # Standardize column names
     df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
@@ -46,7 +46,7 @@ def clean_and_standardize(bronze_df: pd.DataFrame) -> pd.DataFrame:
         df['date'] = pd.to_datetime(df['date'], errors='coerce')
         null_dates = df['date'].isnull().sum()
         if null_dates > 0:
-            logger.warning(f"Found {null_dates} rows with invalid 'date' values.")
+            logger.warning("Found %s rows with invalid 'date' values.", null_dates)
 
     # Add audit column
     df['cleaned_timestamp'] = pd.Timestamp.utcnow()
@@ -72,7 +72,7 @@ def clean_bronze_to_silver(bronze_df: pd.DataFrame, output_path: str) -> pd.Data
     silver_path.parent.mkdir(parents=True, exist_ok=True)
     silver_df.to_parquet(silver_path, index=False)
 
-    logger.info(f"Cleaned Bronze data: removed {initial_count - final_count} rows (duplicates/nulls).")
-    logger.info(f"Saved Silver data to {silver_path} with {final_count} records.")
+    logger.info("Cleaned Bronze data: removed %s rows (duplicates/nulls).", initial_count - final_count)
+    logger.info("Saved Silver data to %s with %s records.", silver_path, final_count)
 
     return silver_df
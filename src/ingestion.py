@@ -4,11 +4,70 @@ from pathlib import Path
 import pandas as pd
 import shutil
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 from src.utils import validate_schema
 
 logger = logging.getLogger(__name__)
 
+def list_input_files(input_dir: str, supported_formats: List[str] = ['csv', 'json']) -> List[Path]:
+    """
+    Lists source files in ingestion order (by format, then name).
+
+    Parameters:
+        input_dir (str): Path to source raw files.
+        supported_formats (List[str]): File extensions to include.
+
+    Returns:
+        List[Path]: Matching files; empty if input_dir does not exist.
+    """
+    input_path = Path(input_dir)
+    if not input_path.exists():
+        logger.error("Input directory %s does not exist.", input_dir)
+        return []
+    return [
+        file_path
+        for ext in supported_formats
+        for file_path in sorted(input_path.glob(f'*.{ext}'))
+    ]
+
+
+def ingest_file(file_path: Path, output_path: Path, schema: Dict) -> Optional[pd.DataFrame]:
+    """
+    Reads one source file, validates its schema and copies it to the bronze zone.
+
+    Parameters:
+        file_path (Path): Source CSV or JSON-lines file.
+        output_path (Path): Bronze directory for the lineage copy.
+        schema (dict): Expected schema for validation.
+
+    Returns:
+        Optional[pd.DataFrame]: File contents, or None if it was skipped.
+    """
+    try:
+        if file_path.suffix == '.csv':
+            df = pd.read_csv(file_path)
+        else:
+            df = pd.read_json(file_path, lines=True)
+
+        if not validate_schema(df, schema):
+            logger.warning("Schema validation failed for %s. Skipping file.", file_path.name)
+            return None
+
+        try:
+            dest_file = output_path / file_path.name
+            shutil.copy2(file_path, dest_file)
+            logger.info("Ingested and copied %s to bronze zone.", file_path.name)
+        except Exception as copy_err:
+            logger.error("Failed to copy %s to bronze zone: %s", file_path.name, copy_err)
+            return None  # Skip adding to data if we can't preserve lineage
+
+        return df
+
+    except Exception as e:
+        logger.error("Failed to ingest %s: %s", file_path.name, e)
+        return None
+
+
 def ingest_files(
     input_dir: str,
     output_dir: str,
@@ -28,41 +87,19 @@ def ingest_files(
     Returns:
         pd.DataFrame: Concatenated DataFrame of ingested and validated files. Empty if none.
     """
-    input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    if not input_path.exists():
-        logger.error(f"Input directory {input_dir} does not exist.")
+    if not Path(input_dir).exists():
+        logger.error("Input directory %s does not exist.", input_dir)
         return pd.DataFrame()
 
     all_data = []
-    files_processed = 0
-    for ext in supported_formats:
-        for file_path in sorted(input_path.glob(f'*.{ext}')):
-            files_processed += 1
-            try:
-                if ext == 'csv':
-                    df = pd.read_csv(file_path)
-                else:
-                    df = pd.read_json(file_path, lines=True)
-
-                if not validate_schema(df, schema):
-                    logger.warning(f"Schema validation failed for {file_path.name}. Skipping file.")
-                    continue
-
-                try:
-                    dest_file = output_path / file_path.name
-                    shutil.copy2(file_path, dest_file)
-                    logger.info(f"Ingested and copied {file_path.name} to bronze zone.")
-                except Exception as copy_err:
-                    logger.error(f"Failed to copy {file_path.name} to bronze zone: {copy_err}")
-                    continue  # Skip adding to data if we can't preserve lineage
-
-                all_data.append(df)
-
-            except Exception as e:
-                logger.error(f"Failed to ingest {file_path.name}: {e}")
-
-    logger.info(f"Processed {files_processed} files from {input_dir}.")
+    files = list_input_files(input_dir, supported_formats)
+    for file_path in files:
+        df = ingest_file(file_path, output_path, schema)
+        if df is not None:
+            all_data.append(df)
+
+    logger.info("Processed %s files from %s.", len(files), input_dir)
     return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
@@ -0,0 +1,302 @@
+# src/multi_runner.py
+
+"""
+Multi-dataset runner - schedules many pipeline configs over one warm worker pool.
+
+Each worker process imports pandas/matplotlib and the pipeline once, then
+runs dataset after dataset. Concurrency is capped by the pool size and each
+worker's address space can be capped with memory_limit_mb; a dataset that
+exceeds it fails on its own without stopping the others (datasets that were
+running beside it when the worker died are re-run).
+"""
+
+import glob
+import json
+import logging
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.utils import load_config, stop_logging
+
+logger = logging.getLogger(__name__)
+
+# Config keys (with run_pipeline defaults) that must be unique per dataset,
+# so concurrent runs never share outputs or log files
+ISOLATED_PATH_KEYS = {
+    "bronze_path": None,
+    "silver_path": None,
+    "gold_path": None,
+    "reports_path": "reports/",
+    "logs_path": "logs",
+}
+
+# Address space a worker needs beyond its starting size (thread stacks, Arrow pools)
+MEMORY_HEADROOM_MB = 256
+
+
+def expand_config_paths(patterns: Iterable[str]) -> List[str]:
+    """
+    Expands config paths and glob patterns into a sorted, de-duplicated list.
+
+    Args:
+        patterns (Iterable[str]): Paths or globs such as 'configs/tenants/*.yaml'.
+
+    Returns:
+        List[str]: Matching config file paths.
+
+    Raises:
+        FileNotFoundError: If a pattern matches no file.
+    """
+    paths: List[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not matches or not all(os.path.exists(match) for match in matches):
+            raise FileNotFoundError(f"No config file matches {pattern}")
+        paths.extend(match for match in matches if match not in paths)
+    return paths
+
+
+def dataset_name(config: Dict[str, Any], config_path: str) -> str:
+    """Returns the config's 'dataset_name', defaulting to the config file stem."""
+    return str(config.get("dataset_name") or Path(config_path).stem)
+
+
+def check_isolation(configs: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Verifies that no two datasets write to the same output or log directory.
+
+    Args:
+        configs (Dict[str, Dict[str, Any]]): Loaded configs keyed by config path.
+
+    Raises:
+        ValueError: If a path is shared by several datasets.
+    """
+    owners: Dict[str, str] = {}
+    conflicts = []
+    for config_path, config in configs.items():
+        for key, default in ISOLATED_PATH_KEYS.items():
+            value = config.get(key, default)
+            if value is None:
+                continue
+            resolved = str(Path(value).resolve())
+            if resolved in owners:
+                conflicts.append(f"{key} {resolved} ({owners[resolved]}, {config_path})")
+            else:
+                owners[resolved] = config_path
+    if conflicts:
+        raise ValueError("Datasets share output paths: " + "; ".join(conflicts))
+
+
+def _address_space_mb() -> Optional[int]:
+    """Returns this process's virtual memory size in MB (Linux only)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmSize:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def check_memory_limit(memory_limit_mb: Optional[int]) -> None:
+    """
+    Rejects per-worker limits that leave no room above a worker's starting size.
+
+    Workers start as copies of this process, so a limit below its current
+    address space would make even thread creation fail (and can hang).
+
+    Raises:
+        ValueError: If memory_limit_mb is below the current size plus headroom.
+    """
+    baseline = _address_space_mb()
+    if memory_limit_mb and baseline and memory_limit_mb < baseline + MEMORY_HEADROOM_MB:
+        raise ValueError(
+            f"memory_limit_mb={memory_limit_mb} is too low: workers start at ~{baseline} MB "
+            f"of address space and need at least {MEMORY_HEADROOM_MB} MB headroom"
+        )
+
+
+def _init_worker(memory_limit_mb: Optional[int]) -> None:
+    """Pool initializer: caps the worker's address space and warms imports."""
+    # Drop any queue listener state inherited from the parent on fork
+    stop_logging()
+
+    if memory_limit_mb:
+        try:
+            import resource
+
+            limit = int(memory_limit_mb) * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError) as e:
+            logging.getLogger(__name__).warning("Could not apply memory limit: %s", e)
+
+    # Import the heavy stack once per worker, not once per dataset
+    import src.pipeline  # noqa: F401
+
+
+def _run_dataset(config_path: str) -> Dict[str, Any]:
+    """Runs one dataset inside a worker, logging to that dataset's logs_path."""
+    from src.pipeline import run_pipeline, setup_pipeline_logging
+
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"config": config_path, "pid": os.getpid()}
+    try:
+        config = load_config(config_path)
+        result["dataset"] = dataset_name(config, config_path)
+        setup_pipeline_logging(config)
+        result.update(run_pipeline(config))
+    except MemoryError:
+        result["status"] = "failed"
+        result["error"] = "MemoryError: dataset exceeded the worker memory limit"
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    finally:
+        stop_logging()
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_many(
+    config_paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    memory_limit_mb: Optional[int] = None,
+    summary_path: Optional[str] = None,
+    max_retries: int = 1,
+) -> Dict[str, Any]:
+    """
+    Runs many pipeline configs over one shared, size-limited process pool.
+
+    At most max_workers datasets run at once. If a worker dies (e.g. killed
+    for exceeding its memory limit), the pool is restarted and the datasets
+    that were still running are re-run one at a time, so the one that killed
+    the worker is identified without failing the others. A dataset is marked
+    failed once it has broken the pool more than max_retries times.
+
+    Args:
+        config_paths (Iterable[str]): Config paths or glob patterns.
+        max_workers (int, optional): Pool size; defaults to the CPU count.
+        memory_limit_mb (int, optional): Address-space cap per worker process
+            (POSIX only). Must leave MEMORY_HEADROOM_MB above a worker's starting size.
+        summary_path (str, optional): Where to write the combined JSON summary.
+        max_retries (int): Re-runs allowed for a dataset that was running when
+            a worker died.
+
+    Returns:
+        Dict[str, Any]: Combined summary with per-dataset status and timings.
+    """
+    paths = expand_config_paths(config_paths)
+    configs = {path: load_config(path) for path in paths}
+    check_isolation(configs)
+    check_memory_limit(memory_limit_mb)
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(paths)))
+    logger.info(
+        "Running %s datasets on %s workers (memory limit per worker: %s MB)",
+        len(paths),
+        workers,
+        memory_limit_mb or "none",
+    )
+
+    started = time.perf_counter()
+    pending = list(paths)
+    results: Dict[str, Dict[str, Any]] = {}
+    # Datasets that were running when a worker died; they run alone from then on
+    suspects: Set[str] = set()
+    retries: Dict[str, int] = {}
+    while pending:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(memory_limit_mb,)
+        ) as pool:
+            in_flight: Dict[Future, str] = {}
+            try:
+                while pending or in_flight:
+                    while pending and len(in_flight) < workers:
+                        running = set(in_flight.values())
+                        if running and (pending[0] in suspects or running & suspects):
+                            break
+                        path = pending.pop(0)
+                        in_flight[pool.submit(_run_dataset, path)] = path
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path = in_flight[future]
+                        results[path] = future.result()
+                        del in_flight[future]
+                        logger.info(
+                            "Dataset %s finished: %s in %ss",
+                            results[path].get("dataset", path),
+                            results[path]["status"],
+                            results[path]["seconds"],
+                        )
+            except BrokenProcessPool:
+                requeue = []
+                for future, path in in_flight.items():
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        results[path] = future.result()
+                        continue
+                    retries[path] = retries.get(path, 0) + 1
+                    if retries[path] > max_retries:
+                        results[path] = {
+                            "config": path,
+                            "dataset": dataset_name(configs[path], path),
+                            "status": "failed",
+                            "error": "Worker process died (memory limit exceeded or crash)",
+                        }
+                        logger.error("Worker died while running %s; marking it failed.", path)
+                    else:
+                        requeue.append(path)
+                if requeue:
+                    logger.warning(
+                        "Worker died while running %s; restarting pool and re-running "
+                        "them one at a time.",
+                        ", ".join(requeue),
+                    )
+                suspects.update(requeue)
+                pending[:0] = requeue
+
+    datasets = [results[path] for path in paths]
+    summary = {
+        "datasets": datasets,
+        "total": len(datasets),
+        "succeeded": sum(1 for r in datasets if r["status"] == "success"),
+        "failed": sum(1 for r in datasets if r["status"] == "failed"),
+        "no_data": sum(1 for r in datasets if r["status"] == "no_data"),
+        "workers": workers,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    logger.info(
+        "Multi-dataset run complete: %s succeeded, %s failed, %s without data in %ss",
+        summary["succeeded"],
+        summary["failed"],
+        summary["no_data"],
+        summary["seconds"],
+    )
+
+    if summary_path:
+        Path(summary_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(summary_path).write_text(json.dumps(summary, indent=2, default=str))
+        logger.info("Saved run summary to %s", summary_path)
+    return summary
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Renders a combined run summary as a plain-text table."""
+    lines = [f"{'dataset':<30} {'status':<8} {'seconds':>8} {'gold rows':>10}  error"]
+    for result in summary["datasets"]:
+        lines.append(
+            f"{str(result.get('dataset', result['config'])):<30} {result['status']:<8} "
+            f"{result.get('seconds', ''):>8} {result.get('rows', {}).get('gold', ''):>10}  "
+            f"{result.get('error', '')}"
+        )
+    lines.append(
+        f"{summary['succeeded']}/{summary['total']} succeeded on {summary['workers']} workers "
+        f"in {summary['seconds']}s"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,200 @@
+# src/pipeline.py
+
+"""
+Pipeline module - runs Ingest → Bronze → Silver → Gold → Visual for one config.
+
+With 'pipelined.enabled' in the config, Ingest → Bronze → Silver runs with
+reading, cleaning and writing overlapped (see src/pipelined.py).
+
+Shared by run_pipeline.py (single dataset) and the multi-dataset runner so a
+warm worker process can execute many configs without re-importing anything.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from src.bronze_to_silver import clean_and_standardize
+from src.ingestion import ingest_files
+from src.pipelined import run_bronze_silver_pipelined
+from src.profiling import profile_dataframe
+from src.silver_to_gold import aggregate_and_enrich, aggregate_windows
+from src.utils import setup_logging
+from src.visualization import generate_visualizations
+
+logger = logging.getLogger(__name__)
+
+
+def setup_pipeline_logging(config: Dict[str, Any]) -> None:
+    """
+    Configures queued logging into the config's logs_path/pipeline.log.
+
+    Args:
+        config (Dict[str, Any]): Loaded pipeline configuration.
+    """
+    logs_dir = Path(config.get("logs_path", "logs"))
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    setup_logging(
+        default_level=config.get("log_level", "INFO"),
+        log_file=str(logs_dir / "pipeline.log"),
+        json_format=bool(config.get("log_json", False)),
+        rate_limit=config.get("log_rate_limit", 20),
+    )
+
+
+def _run_bronze_silver_serial(
+    config: Dict[str, Any],
+    summary: Dict[str, Any],
+    finish_stage: Callable[[str, float], float],
+) -> Tuple[Optional[pd.DataFrame], float]:
+    """Runs Ingest → Bronze → Silver one stage after another; None if no data."""
+    # Ingest raw data → Bronze
+    logger.info("Starting ingestion to Bronze layer")
+    stage = time.perf_counter()
+    bronze_df = ingest_files(config["input_path"], config["bronze_path"], config.get("schema", {}))
+
+    if bronze_df.empty:
+        logger.warning("No data ingested. Exiting pipeline.")
+        summary["status"] = "no_data"
+        return None, stage
+
+    bronze_path = Path(config["bronze_path"])
+    bronze_path.mkdir(parents=True, exist_ok=True)
+    bronze_file = bronze_path / "bronze_data.parquet"
+    bronze_df.to_parquet(bronze_file, index=False)
+    logger.info("Bronze data saved to %s", bronze_file)
+    summary["rows"]["bronze"] = len(bronze_df)
+    stage = finish_stage("bronze", stage)
+
+    # Bronze → Silver transformation
+    logger.info("Starting Bronze to Silver transformation")
+    silver_df = clean_and_standardize(bronze_df)
+    silver_path = Path(config["silver_path"])
+    silver_path.mkdir(parents=True, exist_ok=True)
+    silver_file = silver_path / "silver_data.parquet"
+    silver_df.to_parquet(silver_file, index=False)
+    logger.info("Silver data saved to %s", silver_file)
+    summary["rows"]["silver"] = len(silver_df)
+
+    reports_path = Path(config.get("reports_path", "reports/"))
+    profile_dataframe(silver_df).save(str(reports_path / "silver_profile.json"))
+    stage = finish_stage("silver", stage)
+    return silver_df, stage
+
+
+def _run_bronze_silver_pipelined(
+    config: Dict[str, Any],
+    summary: Dict[str, Any],
+    finish_stage: Callable[[str, float], float],
+) -> Tuple[Optional[pd.DataFrame], float]:
+    """Runs Ingest → Bronze → Silver with reading, cleaning and writing overlapped."""
+    pipelined = config.get("pipelined") or {}
+    logger.info("Starting pipelined ingestion and Bronze to Silver transformation")
+    stage = time.perf_counter()
+    silver_df, silver_profile, stats = run_bronze_silver_pipelined(
+        config,
+        read_ahead=pipelined.get("read_ahead", 2),
+        write_behind=pipelined.get("write_behind", 2),
+    )
+    summary["mode"] = "pipelined"
+    summary["pipelined"] = stats
+
+    if stats["bronze_rows"] == 0:
+        logger.warning("No data ingested. Exiting pipeline.")
+        summary["status"] = "no_data"
+        return None, stage
+
+    summary["rows"]["bronze"] = stats["bronze_rows"]
+    summary["rows"]["silver"] = len(silver_df)
+    reports_path = Path(config.get("reports_path", "reports/"))
+    if silver_profile is None:
+        silver_profile = profile_dataframe(silver_df)
+    silver_profile.save(str(reports_path / "silver_profile.json"))
+    stage = finish_stage("bronze_silver", stage)
+    return silver_df, stage
+
+
+def run_pipeline(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs all pipeline stages for one loaded configuration.
+
+    Args:
+        config (Dict[str, Any]): Loaded pipeline configuration.
+
+    Returns:
+        Dict[str, Any]: Run summary with 'status' ('success' or 'no_data'),
+        'mode' ('serial' or 'pipelined'), row counts per layer, seconds per
+        stage and end-to-end rows_per_second.
+    """
+    summary: Dict[str, Any] = {
+        "status": "success",
+        "mode": "serial",
+        "rows": {},
+        "stage_seconds": {},
+    }
+    started = time.perf_counter()
+
+    def finish_stage(name: str, stage_started: float) -> float:
+        summary["stage_seconds"][name] = round(time.perf_counter() - stage_started, 3)
+        return time.perf_counter()
+
+    logger.info("Starting Data Pipeline Execution")
+
+    pipelined = config.get("pipelined") or {}
+    if pipelined.get("enabled", False):
+        silver_df, stage = _run_bronze_silver_pipelined(config, summary, finish_stage)
+    else:
+        silver_df, stage = _run_bronze_silver_serial(config, summary, finish_stage)
+    if silver_df is None:
+        return summary
+
+    # Silver → Gold transformation
+    logger.info("Starting Silver to Gold transformation")
+    gold_df = aggregate_and_enrich(silver_df, sketches=bool(config.get("gold_sketches", False)))
+    gold_path = Path(config["gold_path"])
+    gold_path.mkdir(parents=True, exist_ok=True)
+    gold_file = gold_path / "gold_data.parquet"
+    gold_df.to_parquet(gold_file, index=False)
+    logger.info("Gold data saved to %s", gold_file)
+    summary["rows"]["gold"] = len(gold_df)
+
+    # Silver → windowed Gold (incremental per-(id, bucket) partials)
+    window_config = config.get("gold_windows") or {}
+    if window_config.get("enabled", False):
+        logger.info("Starting windowed Gold aggregation")
+        windowed = aggregate_windows(
+            silver_df,
+            gold_path=str(gold_path),
+            freq=window_config.get("freq", "D"),
+            windows=window_config.get("windows", [7, 30]),
+            mode=window_config.get("mode", "replace"),
+        )
+        summary["rows"]["gold_windows"] = len(windowed)
+    stage = finish_stage("gold", stage)
+
+    # Profile Gold in one pass; visualizations draw from the profile
+    logger.info("Profiling Gold layer")
+    reports_path = Path(config.get("reports_path", "reports/"))
+    gold_profile = profile_dataframe(gold_df)
+    gold_profile.save(str(reports_path / "gold_profile.json"))
+
+    # Generate visualizations
+    logger.info("Generating visualizations")
+    reports_path.mkdir(parents=True, exist_ok=True)
+    generate_visualizations(gold_df, output_dir=str(reports_path), profile=gold_profile)
+    logger.info("Visualizations generated and saved")
+    finish_stage("visual", stage)
+
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    summary["rows_per_second"] = round(summary["rows"]["bronze"] / max(summary["seconds"], 1e-9), 1)
+    logger.info(
+        "Data Pipeline Execution completed successfully: %s rows in %ss (%s rows/s, %s)",
+        summary["rows"]["bronze"],
+        summary["seconds"],
+        summary["rows_per_second"],
+        summary["mode"],
+    )
+    return summary
@@ -0,0 +1,346 @@
+# src/pipelined.py
+
+"""
+Pipelined Bronze → Silver execution - overlaps reading, cleaning and writing.
+
+Three stages run concurrently, connected by bounded queues:
+
+    reader thread   read + validate + copy file N+1   ─┐ read_ahead
+    main thread     clean file N → Silver chunk       ─┤
+    writer thread   append chunk N-1 to Parquet,      ─┘ write_behind
+                    profile Silver chunk N-1
+
+Bounded queues provide backpressure: a fast reader stalls once read_ahead
+chunks are waiting, and cleaning stalls once write_behind chunks are unwritten,
+so at most read_ahead + write_behind raw chunks are in flight. Memory still
+grows with the data: Silver is kept for the Gold stage, and the reader keeps
+8 bytes per distinct raw row for deduplication. Bronze and Silver are streamed
+into the same bronze_data.parquet / silver_data.parquet files the serial path
+writes.
+
+Like the serial path, duplicates are raw Bronze rows. The reader thread marks
+each row's first occurrence across all files (by 64-bit hashes of the raw
+rows, checked against a sorted array of earlier hashes), so cleaning only sees
+rows the serial path would keep.
+
+Cleaning a chunk on its own can cast differently than cleaning all of Bronze:
+ids 1, 2 in one file and 3, <empty> in another are '1', '2' per chunk but
+'1.0', '2.0' after pd.concat widens the column to float, and 'date' formats
+are inferred per chunk. The reader records each chunk's raw 'id'/'date' dtypes
+and inferred date format; if they differ between chunks, Silver is rebuilt
+from the Bronze file once all chunks are in, so it matches the serial output.
+"""
+
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+from src.bronze_to_silver import clean_and_standardize, clean_bronze_to_silver
+from src.ingestion import ingest_file, list_input_files
+from src.profiling import DataProfile
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class ParquetAppender:
+    """
+    Streams DataFrame chunks into one Parquet file, one row group per chunk.
+
+    Chunks whose schema differs from the file's (e.g. int vs float columns,
+    or extra columns from another source file) are cast to it when Arrow can
+    widen them losslessly; otherwise the file is rewritten once with the
+    combined data, matching what pd.concat would produce.
+
+    Args:
+        path (Path): Output Parquet file (overwritten).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.rows = 0
+        self._writer: Optional[pq.ParquetWriter] = None
+
+    def append(self, df: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._open(table)
+            return
+
+        schema = self._writer.schema
+        if set(table.column_names) == set(schema.names):
+            table = table.select(schema.names)
+            if table.schema.equals(schema, check_metadata=False):
+                self._write(table)
+                return
+            try:
+                unified = pa.unify_schemas([schema, table.schema], promote_options="permissive")
+                if unified.equals(schema, check_metadata=False):
+                    self._write(table.cast(schema))
+                    return
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass
+
+        self._rewrite(df)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _open(self, table: pa.Table) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._write(table)
+
+    def _write(self, table: pa.Table) -> None:
+        assert self._writer is not None  # opened by _open()
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+
+    def _rewrite(self, df: pd.DataFrame) -> None:
+        logger.info(
+            "Schema of new chunk differs from %s; rewriting it with combined schema.",
+            self.path.name,
+        )
+        self.close()
+        existing = pd.read_parquet(self.path)
+        combined = pd.concat([existing, df], ignore_index=True)
+        self.rows = 0
+        self._open(pa.Table.from_pandas(combined, preserve_index=False))
+
+
+class _Stage:
+    """Bounded queue shared by two stages, with time-blocked accounting."""
+
+    def __init__(self, maxsize: int, stop: threading.Event) -> None:
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, int(maxsize)))
+        self.stop = stop
+        self.put_wait = 0.0
+        self.get_wait = 0.0
+
+    def put(self, item: Any) -> bool:
+        started = time.perf_counter()
+        try:
+            while not self.stop.is_set():
+                try:
+                    self.queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            self.put_wait += time.perf_counter() - started
+
+    def get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            while not self.stop.is_set():
+                try:
+                    return self.queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _DONE
+        finally:
+            self.get_wait += time.perf_counter() - started
+
+
+def _row_hashes(bronze_chunk: pd.DataFrame) -> np.ndarray:
+    """Hashes raw rows independently of column order."""
+    keys = bronze_chunk[sorted(bronze_chunk.columns, key=str)]
+    # As in pd.concat, 10 from an int column equals 10.0 from a float one
+    numeric = keys.select_dtypes(include="number").columns
+    keys = keys.astype({column: "float64" for column in numeric})
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def _first_seen(row_hashes: np.ndarray, seen: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Marks the first occurrence of each raw row across chunks.
+
+    Args:
+        row_hashes (np.ndarray): Hashes of the chunk's rows, from _row_hashes.
+        seen (np.ndarray): Sorted hashes of all earlier chunks' rows.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Boolean mask of rows seen neither earlier
+        in the chunk nor in an earlier chunk, and the updated sorted hashes.
+    """
+    unique, first = np.unique(row_hashes, return_index=True)
+    if len(seen):
+        positions = np.searchsorted(seen, unique).clip(max=len(seen) - 1)
+        new = seen[positions] != unique
+        unique, first = unique[new], first[new]
+    keep = np.zeros(len(row_hashes), dtype=bool)
+    keep[first] = True
+    # Both parts are sorted, so the stable (merge-based) sort is linear
+    seen = np.sort(np.concatenate([seen, unique]), kind="stable")
+    return keep, seen
+
+
+def _cast_signature(bronze_chunk: pd.DataFrame) -> Tuple[str, ...]:
+    """Raw 'id'/'date' dtypes and date format, which decide how a chunk is cast when cleaned."""
+    columns = {
+        str(column).strip().lower().replace(" ", "_"): column for column in bronze_chunk.columns
+    }
+    signature = []
+    for name in ("id", "date"):
+        if name not in columns:
+            continue
+        values = bronze_chunk[columns[name]]
+        signature.append(f"{name}: {values.dtype}")
+        first = values.dropna()
+        if name == "date" and len(first) and isinstance(first.iloc[0], str):
+            # pd.to_datetime infers one format from the first non-null string
+            signature.append(f"format: {guess_datetime_format(first.iloc[0])}")
+    return tuple(signature)
+
+
+def run_bronze_silver_pipelined(
+    config: Dict[str, Any],
+    read_ahead: int = 2,
+    write_behind: int = 2,
+) -> Tuple[pd.DataFrame, Optional[DataProfile], Dict[str, Any]]:
+    """
+    Ingests raw files to Bronze and cleans them to Silver with overlapped I/O.
+
+    Args:
+        config (Dict[str, Any]): Loaded pipeline configuration.
+        read_ahead (int): Ingested files that may wait for cleaning.
+        write_behind (int): Cleaned chunks that may wait to be written.
+
+    Returns:
+        Tuple[pd.DataFrame, Optional[DataProfile], Dict[str, Any]]: Silver data,
+        its profile (None if no data or Silver was rebuilt), and stats: row
+        counts, files, whether Silver was rebuilt from Bronze, and seconds each
+        stage spent blocked on its queues.
+    """
+    bronze_dir = Path(config["bronze_path"])
+    bronze_dir.mkdir(parents=True, exist_ok=True)
+    silver_dir = Path(config["silver_path"])
+    silver_dir.mkdir(parents=True, exist_ok=True)
+    files = list_input_files(config["input_path"])
+
+    stop = threading.Event()
+    reads = _Stage(read_ahead, stop)
+    writes = _Stage(write_behind, stop)
+    errors: List[BaseException] = []
+    bronze_sink = ParquetAppender(bronze_dir / "bronze_data.parquet")
+    silver_sink = ParquetAppender(silver_dir / "silver_data.parquet")
+    profile = DataProfile()
+
+    signatures: Set[Tuple[str, ...]] = set()
+
+    def read_files() -> None:
+        seen = np.empty(0, dtype=np.uint64)
+        try:
+            for file_path in files:
+                df = ingest_file(file_path, bronze_dir, config.get("schema", {}))
+                if df is None:
+                    continue
+                keep, seen = _first_seen(_row_hashes(df), seen)
+                signatures.add(_cast_signature(df))
+                if not reads.put((df, keep)):
+                    return
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            reads.put(_DONE)
+
+    def write_chunks() -> None:
+        try:
+            while True:
+                item = writes.get()
+                if item is _DONE:
+                    break
+                bronze_chunk, silver_chunk = item
+                bronze_sink.append(bronze_chunk)
+                if not silver_chunk.empty:
+                    silver_sink.append(silver_chunk)
+                    profile.update(silver_chunk)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            bronze_sink.close()
+            silver_sink.close()
+
+    reader = threading.Thread(target=read_files, name="pipeline-reader", daemon=True)
+    writer = threading.Thread(target=write_chunks, name="pipeline-writer", daemon=True)
+    reader.start()
+    writer.start()
+
+    silver_parts: List[pd.DataFrame] = []
+    chunks = 0
+    try:
+        while True:
+            item = reads.get()
+            if item is _DONE:
+                break
+            bronze_chunk, keep = item
+            chunks += 1
+            silver_chunk = clean_and_standardize(bronze_chunk[keep])
+            if not silver_chunk.empty:
+                silver_parts.append(silver_chunk)
+            if not writes.put((bronze_chunk, silver_chunk)):
+                break
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        writes.put(_DONE)
+        reader.join()
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
+    logger.info("Processed %s files from %s.", len(files), config["input_path"])
+    rebuilt = len(signatures) > 1 and bool(silver_parts)
+    if rebuilt:
+        logger.warning(
+            "Raw files disagree on 'id'/'date' types %s; rebuilding Silver from Bronze.",
+            sorted(signatures),
+        )
+        silver_df = clean_bronze_to_silver(pd.read_parquet(bronze_sink.path), str(silver_sink.path))
+    elif silver_parts:
+        silver_df = pd.concat(silver_parts, ignore_index=True)
+    else:
+        silver_df = pd.DataFrame()
+        # Don't leave a Silver file from an earlier run behind
+        silver_sink.path.unlink(missing_ok=True)
+
+    stats = {
+        "files": len(files),
+        "chunks": chunks,
+        "bronze_rows": bronze_sink.rows,
+        "silver_rows": len(silver_df),
+        "silver_rebuilt": rebuilt,
+        "read_ahead": reads.queue.maxsize,
+        "write_behind": writes.queue.maxsize,
+        # Time each stage was stalled: producer on a full queue, consumer on an empty one
+        "blocked_seconds": {
+            "reader": round(reads.put_wait, 3),
+            "transform": round(reads.get_wait + writes.put_wait, 3),
+            "writer": round(writes.get_wait, 3),
+        },
+    }
+    logger.info(
+        "Pipelined Bronze/Silver: %s chunks, blocked seconds %s", chunks, stats["blocked_seconds"]
+    )
+    return silver_df, (profile if silver_parts and not rebuilt else None), stats
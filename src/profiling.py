@@ -0,0 +1,453 @@
+# src/profiling.py
+
+"""
+Profiling module - one-pass, mergeable data profile for pipeline layers.
+
+Computes per column, in a single streaming pass over DataFrame chunks:
+- Row and null counts
+- min / max (numeric and datetime columns)
+- mean / variance (Welford, merged with Chan's parallel formula)
+- Approximate quantiles (KLL-style sketch) and distinct counts (HyperLogLog)
+- Pairwise covariance co-moments for numeric columns (for correlation)
+
+Profiles from different chunks or worker processes combine with ``merge`` and
+persist as JSON, so reports and plots never need to rescan the data.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.sketches import HyperLogLog, QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnProfile:
+    """
+    Mergeable statistics for a single column.
+
+    Args:
+        name (str): Column name.
+        dtype (str): pandas dtype name of the column.
+        quantile_k (int): Accuracy parameter of the quantile sketch.
+        hll_precision (int): Precision of the distinct-count sketch.
+    """
+
+    def __init__(
+        self, name: str, dtype: str, quantile_k: int = 200, hll_precision: int = 12
+    ) -> None:
+        self.name = name
+        self.dtype = dtype
+        self.count = 0
+        self.null_count = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.quantiles: Optional[QuantileSketch] = None
+        self.distinct = HyperLogLog(p=hll_precision)
+        self._quantile_k = quantile_k
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.quantiles is not None
+
+    @property
+    def non_null(self) -> int:
+        return self.count - self.null_count
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1), NaN with fewer than two values."""
+        return self.m2 / (self.non_null - 1) if self.non_null > 1 else math.nan
+
+    def update(self, series: pd.Series) -> None:
+        """Adds one chunk of the column."""
+        nulls = int(series.isna().sum())
+        self.count += len(series)
+        self.null_count += nulls
+        self.distinct.update(series)
+
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            if self.quantiles is None:
+                self.quantiles = QuantileSketch(k=self._quantile_k)
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if values.size == 0:
+                return
+            self.quantiles.update(values)
+            self._merge_moments(
+                values.size, float(values.mean()), float(((values - values.mean()) ** 2).sum())
+            )
+            self._merge_bounds(float(values.min()), float(values.max()))
+        elif pd.api.types.is_datetime64_any_dtype(series) and len(series) > nulls:
+            self._merge_bounds(series.min().isoformat(), series.max().isoformat())
+
+    def _merge_moments(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        n_a = self.non_null - n_b  # counts were already advanced by update/merge
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+
+    def _merge_bounds(self, vmin: Any, vmax: Any) -> None:
+        self.min = vmin if self.min is None else min(self.min, vmin)
+        self.max = vmax if self.max is None else max(self.max, vmax)
+
+    def merge(self, other: "ColumnProfile") -> None:
+        """Merges the profile of the same column from another chunk."""
+        self.count += other.count
+        self.null_count += other.null_count
+        self.distinct.merge(other.distinct)
+        if other.quantiles is not None:
+            if self.quantiles is None:
+                self.quantiles = QuantileSketch(k=other.quantiles.k)
+            self.quantiles.merge(other.quantiles)
+        if other.non_null and other.is_numeric:
+            self._merge_moments(other.non_null, other.mean, other.m2)
+        if other.min is not None:
+            self._merge_bounds(other.min, other.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "dtype": self.dtype,
+            "count": self.count,
+            "null_count": self.null_count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "m2": self.m2,
+            "quantiles": self.quantiles.to_dict() if self.quantiles is not None else None,
+            "distinct": self.distinct.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnProfile":
+        col = cls(data["name"], data["dtype"], hll_precision=data["distinct"]["p"])
+        col.count = data["count"]
+        col.null_count = data["null_count"]
+        col.min = data["min"]
+        col.max = data["max"]
+        col.mean = data["mean"]
+        col.m2 = data["m2"]
+        if data["quantiles"] is not None:
+            col.quantiles = QuantileSketch.from_dict(data["quantiles"])
+        col.distinct = HyperLogLog.from_dict(data["distinct"])
+        return col
+
+
+class _CoMoments:
+    """
+    Pairwise-complete co-moment matrices for numeric columns.
+
+    For every column pair (i, j), tracks over rows where both are non-null:
+    n[i, j], mean of column i (mean[i, j]), its M2 (m2[i, j]) and the
+    co-moment c[i, j]. This reproduces ``DataFrame.corr()`` semantics.
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.n = np.zeros((0, 0))
+        self.mean = np.zeros((0, 0))
+        self.m2 = np.zeros((0, 0))
+        self.c = np.zeros((0, 0))
+
+    def _align(self, names: List[str]) -> None:
+        new = [name for name in names if name not in self.names]
+        if not new:
+            return
+        size = len(self.names) + len(new)
+        for attr in ("n", "mean", "m2", "c"):
+            grown = np.zeros((size, size))
+            old = getattr(self, attr)
+            grown[: old.shape[0], : old.shape[1]] = old
+            setattr(self, attr, grown)
+        self.names.extend(new)
+
+    def _combine(
+        self,
+        idx: np.ndarray,
+        n_b: np.ndarray,
+        mean_b: np.ndarray,
+        m2_b: np.ndarray,
+        c_b: np.ndarray,
+    ) -> None:
+        sub = np.ix_(idx, idx)
+        n_a, mean_a = self.n[sub], self.mean[sub]
+        n = n_a + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            frac_b = np.where(n > 0, n_b / n, 0.0)
+            cross = np.where(n > 0, n_a * n_b / n, 0.0)
+        delta = mean_b - mean_a
+        self.mean[sub] = mean_a + delta * frac_b
+        self.m2[sub] += m2_b + delta * delta * cross
+        self.c[sub] += c_b + delta * delta.T * cross
+        self.n[sub] = n
+
+    def update(self, numeric: pd.DataFrame) -> None:
+        if numeric.shape[1] == 0:
+            return
+        names = [str(col) for col in numeric.columns]
+        self._align(names)
+        x = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(x)
+        # Shift by column means for numerical stability; co-moments are shift invariant
+        counts = present.sum(axis=0)
+        shift = np.where(present, x, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        xc = np.where(present, x - shift, 0.0)
+        mask = present.astype(np.float64)
+
+        n_b = mask.T @ mask
+        sums = xc.T @ mask  # sums[i, j]: sum of column i over rows where j is present
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_c = np.where(n_b > 0, sums / n_b, 0.0)
+            m2_b = np.where(n_b > 0, (xc * xc).T @ mask - sums * mean_c, 0.0)
+            c_b = np.where(n_b > 0, xc.T @ xc - sums * sums.T / np.where(n_b > 0, n_b, 1.0), 0.0)
+        mean_b = np.where(n_b > 0, mean_c + shift[:, np.newaxis], 0.0)
+
+        idx = np.array([self.names.index(name) for name in names])
+        self._combine(idx, n_b, mean_b, m2_b, c_b)
+
+    def merge(self, other: "_CoMoments") -> None:
+        if not other.names:
+            return
+        self._align(other.names)
+        idx = np.array([self.names.index(name) for name in other.names])
+        self._combine(idx, other.n, other.mean, other.m2, other.c)
+
+    def correlation(self) -> pd.DataFrame:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self.c / np.sqrt(self.m2 * self.m2.T)
+        corr[self.n < 2] = np.nan
+        return pd.DataFrame(corr, index=self.names, columns=self.names)
+
+    def covariance(self) -> pd.DataFrame:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = np.where(self.n > 1, self.c / (self.n - 1), np.nan)
+        return pd.DataFrame(cov, index=self.names, columns=self.names)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "names": self.names,
+            "n": self.n.tolist(),
+            "mean": self.mean.tolist(),
+            "m2": self.m2.tolist(),
+            "c": self.c.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_CoMoments":
+        moments = cls()
+        moments.names = list(data["names"])
+        size = len(moments.names)
+        for attr in ("n", "mean", "m2", "c"):
+            setattr(moments, attr, np.asarray(data[attr], dtype=np.float64).reshape(size, size))
+        return moments
+
+
+class DataProfile:
+    """
+    One-pass, mergeable profile of a tabular dataset.
+
+    Feed chunks with ``update``; combine profiles from other chunks, workers
+    or runs with ``merge``; persist with ``save``/``load``.
+
+    Args:
+        quantile_k (int): Accuracy parameter of per-column quantile sketches.
+        hll_precision (int): Precision of per-column distinct-count sketches.
+    """
+
+    def __init__(self, quantile_k: int = 200, hll_precision: int = 12) -> None:
+        self.quantile_k = quantile_k
+        self.hll_precision = hll_precision
+        self.row_count = 0
+        self.columns: Dict[str, ColumnProfile] = {}
+        self._moments = _CoMoments()
+
+    def update(self, df: pd.DataFrame) -> "DataProfile":
+        """
+        Adds one chunk of rows to the profile.
+
+        Args:
+            df (pd.DataFrame): Chunk of the dataset.
+
+        Returns:
+            DataProfile: self, for chaining.
+        """
+        self.row_count += len(df)
+        for col in df.columns:
+            name = str(col)
+            if name not in self.columns:
+                self.columns[name] = ColumnProfile(
+                    name, str(df[col].dtype), self.quantile_k, self.hll_precision
+                )
+            self.columns[name].update(df[col])
+        numeric = df.select_dtypes(include='number')
+        self._moments.update(numeric)
+        return self
+
+    def merge(self, other: "DataProfile") -> "DataProfile":
+        """
+        Merges a profile built over a disjoint set of rows.
+
+        Args:
+            other (DataProfile): Profile from another chunk, worker or run.
+
+        Returns:
+            DataProfile: self, for chaining.
+        """
+        self.row_count += other.row_count
+        for name, col in other.columns.items():
+            if name not in self.columns:
+                self.columns[name] = ColumnProfile(
+                    name, col.dtype, self.quantile_k, self.hll_precision
+                )
+            self.columns[name].merge(col)
+        self._moments.merge(other._moments)
+        return self
+
+    def null_counts(self) -> pd.Series:
+        """Returns null count per column."""
+        return pd.Series(
+            {name: col.null_count for name, col in self.columns.items()}, dtype='int64'
+        )
+
+    def numeric_columns(self) -> List[str]:
+        """Returns names of numeric columns, in first-seen order."""
+        return [name for name, col in self.columns.items() if col.is_numeric]
+
+    def correlation(self) -> pd.DataFrame:
+        """Returns the Pearson correlation matrix of numeric columns (pairwise complete)."""
+        return self._moments.correlation()
+
+    def covariance(self) -> pd.DataFrame:
+        """Returns the sample covariance matrix of numeric columns (pairwise complete)."""
+        return self._moments.covariance()
+
+    def quantiles(self, column: str, qs: Iterable[float] = (0.25, 0.5, 0.75)) -> pd.Series:
+        """Returns approximate quantiles of a numeric column."""
+        qs = list(qs)
+        sketch = self.columns[column].quantiles
+        values = sketch.quantile(qs) if sketch is not None else np.full(len(qs), np.nan)
+        return pd.Series(values, index=qs, name=column)
+
+    def histogram(self, column: str, bins: int = 30) -> pd.Series:
+        """
+        Returns approximate bin counts of a numeric column from its quantile sketch.
+
+        Args:
+            column (str): Numeric column name.
+            bins (int): Number of equal-width bins between min and max.
+
+        Returns:
+            pd.Series: Counts indexed by bin left edge.
+        """
+        col = self.columns[column]
+        if col.quantiles is None or col.non_null == 0:
+            return pd.Series(dtype='float64')
+        edges = np.linspace(col.min, col.max, bins + 1)
+        cdf = col.quantiles.cdf(edges[1:])
+        counts = np.diff(np.concatenate([[0.0], cdf])) * col.non_null
+        return pd.Series(counts, index=edges[:-1], name=column)
+
+    def summary(self) -> pd.DataFrame:
+        """Returns one row of summary statistics per column."""
+        rows = []
+        for name, col in self.columns.items():
+            quartiles = (
+                np.asarray(col.quantiles.quantile([0.25, 0.5, 0.75]))
+                if col.quantiles is not None and col.non_null
+                else np.full(3, math.nan)
+            )
+            p25, p50, p75 = (float(value) for value in quartiles)
+            rows.append(
+                {
+                    "column": name,
+                    "dtype": col.dtype,
+                    "count": col.count,
+                    "null_count": col.null_count,
+                    "distinct_approx": round(col.distinct.count()),
+                    "min": col.min,
+                    "max": col.max,
+                    "mean": col.mean if col.is_numeric and col.non_null else math.nan,
+                    "std": (
+                        math.sqrt(col.variance) if col.is_numeric and col.non_null > 1 else math.nan
+                    ),
+                    "p25": p25,
+                    "p50": p50,
+                    "p75": p75,
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "quantile_k": self.quantile_k,
+            "hll_precision": self.hll_precision,
+            "row_count": self.row_count,
+            "columns": [col.to_dict() for col in self.columns.values()],
+            "comoments": self._moments.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DataProfile":
+        profile = cls(quantile_k=data["quantile_k"], hll_precision=data["hll_precision"])
+        profile.row_count = data["row_count"]
+        for col in data["columns"]:
+            profile.columns[col["name"]] = ColumnProfile.from_dict(col)
+        profile._moments = _CoMoments.from_dict(data["comoments"])
+        return profile
+
+    def save(self, path: str) -> None:
+        """Writes the profile as JSON."""
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(self.to_dict()))
+        logger.info("Saved data profile of %s rows to %s", self.row_count, out)
+
+    @classmethod
+    def load(cls, path: str) -> "DataProfile":
+        """Reads a profile written by ``save``."""
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+def profile_frames(frames: Iterable[pd.DataFrame], **kwargs: Any) -> DataProfile:
+    """
+    Profiles a stream of DataFrame chunks in one pass.
+
+    Args:
+        frames (Iterable[pd.DataFrame]): Chunks, e.g. from ``pd.read_csv(chunksize=...)``.
+        **kwargs: Passed to ``DataProfile``.
+
+    Returns:
+        DataProfile: Profile over all chunks.
+    """
+    profile = DataProfile(**kwargs)
+    for frame in frames:
+        profile.update(frame)
+    return profile
+
+
+def profile_dataframe(df: pd.DataFrame, chunk_size: int = 100_000, **kwargs: Any) -> DataProfile:
+    """
+    Profiles an in-memory DataFrame in bounded-size chunks.
+
+    Args:
+        df (pd.DataFrame): Data to profile.
+        chunk_size (int): Rows per chunk.
+        **kwargs: Passed to ``DataProfile``.
+
+    Returns:
+        DataProfile: Profile of the whole frame.
+    """
+    return profile_frames(
+        (df.iloc[start : start + chunk_size] for start in range(0, max(len(df), 1), chunk_size)),
+        **kwargs,
+    )
@@ -0,0 +1,188 @@
+# src/shm_transport.py
+
+"""
+Shared-memory DataFrame transport between pipeline processes.
+
+A worker serializes its result once, as an Arrow IPC stream, into a
+``multiprocessing.shared_memory`` segment and returns only a small picklable
+``SharedFrame`` handle. The receiver maps the segment and reads Arrow columns
+straight out of it without copying.
+
+Lifecycle:
+- The segment name is unlinked as soon as the receiver maps it; the memory
+  itself is released when the last Arrow/pandas view of it is garbage collected.
+- While a handle is in flight, the receiving process's resource tracker owns the
+  segment, so it is removed even if the receiver dies before reading it.
+- ``discard`` unlinks a handle that will never be read.
+
+Typical use with a process pool:
+
+    future = pool.submit(call_shared, ingest_files, input_dir, output_dir, schema)
+    df = receive_frame(future.result())
+"""
+
+import ctypes
+import logging
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+def _tracker_name(name: str) -> str:
+    return "/" + name if os.name == "posix" else name
+
+
+class SharedFrame:
+    """
+    Picklable handle to a DataFrame stored in a shared memory segment.
+
+    Unpickling a handle registers the segment with the receiving process's
+    resource tracker, which unlinks it if that process exits without reading it.
+
+    Args:
+        name (str): Shared memory segment name.
+        size (int): Bytes of Arrow IPC data in the segment.
+        num_rows (int): Row count, for logging and sanity checks.
+    """
+
+    def __init__(self, name: str, size: int, num_rows: int) -> None:
+        self.name = name
+        self.size = size
+        self.num_rows = num_rows
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if os.name == "posix":
+            resource_tracker.register(_tracker_name(self.name), "shared_memory")
+
+    def __repr__(self) -> str:
+        return f"SharedFrame(name={self.name!r}, size={self.size}, num_rows={self.num_rows})"
+
+
+def _create_segment(size: int) -> shared_memory.SharedMemory:
+    """Creates a segment owned by whoever receives its handle, not by this process."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    # Otherwise this process's resource tracker unlinks it when a pool worker exits
+    resource_tracker.unregister(_tracker_name(shm.name), "shared_memory")
+    return shm
+
+
+def _write_table(table: pa.Table, buffer: memoryview) -> None:
+    # Scoped so no Arrow object still exports the segment when it is closed
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(buffer))
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    sink.close()
+
+
+def share_frame(df: pd.DataFrame) -> SharedFrame:
+    """
+    Copies a DataFrame into a new shared memory segment as an Arrow IPC stream.
+
+    Pass the returned handle to exactly one ``open_frame`` / ``receive_frame``
+    / ``discard`` call.
+
+    Args:
+        df (pd.DataFrame): Frame to share.
+
+    Returns:
+        SharedFrame: Handle to pass to another process.
+    """
+    table = pa.Table.from_pandas(df)
+    counter = pa.MockOutputStream()
+    with pa.ipc.new_stream(counter, table.schema) as writer:
+        writer.write_table(table)
+    size = counter.size()
+
+    shm = _create_segment(size)
+    try:
+        assert shm.buf is not None  # None only after close()
+        _write_table(table, shm.buf)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    logger.debug("Shared %s rows (%s bytes) in segment %s", table.num_rows, size, shm.name)
+    return SharedFrame(shm.name, size, table.num_rows)
+
+
+def call_shared(func: Callable[..., pd.DataFrame], *args: Any, **kwargs: Any) -> SharedFrame:
+    """
+    Runs func and returns its DataFrame result through shared memory.
+
+    Submit this (instead of func) to a process pool so the result crosses the
+    process boundary as a handle rather than a pickled frame.
+
+    Args:
+        func (Callable[..., pd.DataFrame]): Picklable function returning a DataFrame.
+        *args, **kwargs: Passed to func.
+
+    Returns:
+        SharedFrame: Handle to the result.
+    """
+    return share_frame(func(*args, **kwargs))
+
+
+def open_frame(handle: SharedFrame) -> pa.Table:
+    """
+    Maps a shared frame and returns a zero-copy Arrow table over it.
+
+    The segment is unlinked immediately; its memory stays mapped exactly as
+    long as the table (or anything converted from it without copying) is alive.
+
+    Args:
+        handle (SharedFrame): Handle returned by ``share_frame``.
+
+    Returns:
+        pa.Table: Table whose buffers point into the shared segment.
+    """
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        assert shm.buf is not None  # None only after close()
+        # Take the address without keeping a buffer export, so the segment can
+        # be closed by SharedMemory.__del__ once Arrow drops its base reference
+        view = ctypes.c_char.from_buffer(shm.buf)
+        address = ctypes.addressof(view)
+        del view
+        buffer = pa.foreign_buffer(address, handle.size, base=shm)
+    finally:
+        shm.unlink()
+    return pa.ipc.open_stream(buffer).read_all()
+
+
+def receive_frame(handle: SharedFrame) -> pd.DataFrame:
+    """
+    Reads a shared frame into pandas; the segment is unlinked on receipt.
+
+    Args:
+        handle (SharedFrame): Handle returned by ``share_frame``.
+
+    Returns:
+        pd.DataFrame: The shared frame.
+    """
+    return open_frame(handle).to_pandas()
+
+
+def discard(handle: SharedFrame) -> None:
+    """
+    Unlinks a shared frame without reading it (e.g. after an error).
+
+    Args:
+        handle (SharedFrame): Handle returned by ``share_frame``.
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=handle.name)
+    except FileNotFoundError:
+        return
+    shm.unlink()
+    shm.close()
+    logger.debug("Discarded shared segment %s", handle.name)
@@ -1,13 +1,31 @@
 # src/silver_to_gold.py
 
-from typing import Optional
+from typing import Iterable, Sequence
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from pathlib import Path
 import logging
 
+from src.sketches import HyperLogLog, QuantileSketch, grouped_hyperloglogs, grouped_quantile_sketches
+
 logger = logging.getLogger(__name__)
 
-def aggregate_and_enrich(silver_df: pd.DataFrame, threshold: float = 100.0) -> pd.DataFrame:
+# Percentiles of 'value' reported when sketch columns are enabled
+SKETCH_PERCENTILES = (0.5, 0.95)
+
+
+def _percentile_columns() -> list:
+    return [f"p{int(q * 100)}_value" for q in SKETCH_PERCENTILES]
+
+
+def aggregate_and_enrich(
+    silver_df: pd.DataFrame,
+    threshold: float = 100.0,
+    sketches: bool = False,
+    quantile_k: int = 200,
+    hll_precision: int = 10,
+) -> pd.DataFrame:
     """
     Aggregates and enriches silver layer data to produce KPIs and summary info for gold layer.
 
@@ -23,11 +41,24 @@ def aggregate_and_enrich(silver_df: pd.DataFrame, threshold: float = 100.0) -> p
     - last_date: most recent 'date' per 'id'
     - high_value: boolean KPI flag where sum_value > threshold
 
+    With sketches=True, also adds mergeable distributional KPIs:
+    - p50_value / p95_value: percentiles of 'value' per 'id', exact (as
+      ``Series.quantile``) for ids with at most quantile_k rows, otherwise
+      approximate within ~1.65% rank error for k=200
+    - distinct_active_days: approximate distinct 'date' days per 'id'
+      (HyperLogLog, relative standard error 1.04 / sqrt(2**hll_precision),
+      near-exact for small counts)
+    - value_sketch / active_days_sketch: serialized sketches (binary) that
+      ``merge_gold_sketches`` combines across runs and shards
+
     Adds audit column 'kpi_generated_at' with current UTC timestamp.
 
     Parameters:
         silver_df (pd.DataFrame): Input cleaned silver layer data.
         threshold (float): Threshold to flag high_value KPI.
+        sketches (bool): Add percentile/distinct-day KPIs and sketch columns.
+        quantile_k (int): Accuracy parameter of the value quantile sketches.
+        hll_precision (int): Precision of the active-day HyperLogLogs.
 
     Returns:
         pd.DataFrame: Aggregated Gold layer DataFrame with KPIs.
@@ -63,11 +94,257 @@ def aggregate_and_enrich(silver_df: pd.DataFrame, threshold: float = 100.0) -> p
         last_date=pd.NamedAgg(column='date', aggfunc='max')
     ).reset_index()
 
+    if sketches:
+        grouped = _add_sketch_columns(grouped, silver_df, quantile_k, hll_precision)
+
     # KPI flag
     grouped['high_value'] = grouped['sum_value'] > threshold
 
     # Audit timestamp
     grouped['kpi_generated_at'] = datetime.utcnow()
 
-    logger.info(f"Aggregation complete: {len(grouped)} records aggregated for Gold layer.")
+    logger.info("Aggregation complete: %s records aggregated for Gold layer.", len(grouped))
     return grouped
+
+
+def _day_numbers(dates: pd.Series) -> pd.Series:
+    """Days since the epoch (NaN for NaT), independent of the datetime unit."""
+    days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+    return pd.Series(np.where(dates.isna(), np.nan, days), index=dates.index)
+
+
+def _add_sketch_columns(
+    grouped: pd.DataFrame, silver_df: pd.DataFrame, quantile_k: int, hll_precision: int
+) -> pd.DataFrame:
+    """Builds per-id value and active-day sketches in vectorized batches."""
+    # groupby sorts ids, so factorize with sort=True lines codes up with grouped rows
+    codes, uniques = pd.factorize(silver_df['id'], sort=True)
+    valid = codes >= 0
+    n_groups = len(uniques)
+
+    value_sketches, percentile_values = grouped_quantile_sketches(
+        codes[valid], silver_df['value'].to_numpy(dtype=np.float64)[valid], n_groups,
+        k=quantile_k, qs=SKETCH_PERCENTILES,
+    )
+    for i, col in enumerate(_percentile_columns()):
+        grouped[col] = percentile_values[:, i]
+    grouped['value_sketch'] = value_sketches
+
+    if 'date' in silver_df.columns:
+        days = _day_numbers(silver_df['date'])[valid]
+    else:
+        days = pd.Series(np.nan, index=silver_df.index[valid])
+    day_sketches, day_counts = grouped_hyperloglogs(codes[valid], days, n_groups, p=hll_precision)
+    grouped['distinct_active_days'] = np.round(day_counts).astype('int64')
+    grouped['active_days_sketch'] = day_sketches
+
+    logger.info("Built value and active-day sketches for %s ids.", n_groups)
+    return grouped
+
+
+def merge_gold_sketches(gold_frames: Iterable[pd.DataFrame], threshold: float = 100.0) -> pd.DataFrame:
+    """
+    Combines Gold outputs built with sketches=True from different runs or shards.
+
+    Counts and sums add up, last_date takes the max, and the per-id value and
+    active-day sketches are merged before percentiles and distinct days are
+    re-estimated, so the result matches a single run over the union of inputs
+    within the sketches' error bounds. Inputs must cover disjoint silver rows.
+
+    Parameters:
+        gold_frames (Iterable[pd.DataFrame]): Gold DataFrames with sketch columns.
+        threshold (float): Threshold to flag high_value KPI.
+
+    Returns:
+        pd.DataFrame: Merged Gold layer DataFrame with KPIs and sketch columns.
+    """
+    combined = pd.concat([df for df in gold_frames if not df.empty], ignore_index=True)
+    if combined.empty:
+        logger.warning("No Gold frames to merge. Returning empty DataFrame.")
+        return pd.DataFrame()
+
+    merged = combined.groupby('id').agg(
+        total_count=pd.NamedAgg(column='total_count', aggfunc='sum'),
+        sum_value=pd.NamedAgg(column='sum_value', aggfunc='sum'),
+        last_date=pd.NamedAgg(column='last_date', aggfunc='max'),
+    ).reset_index()
+    merged['avg_value'] = merged['sum_value'] / merged['total_count']
+
+    value_sketches, day_sketches, percentiles, day_counts = [], [], [], []
+    for _, group in combined.groupby('id', sort=True):
+        value_blobs, day_blobs = group['value_sketch'].tolist(), group['active_days_sketch'].tolist()
+        value_sketch = QuantileSketch.from_bytes(value_blobs[0])
+        day_sketch = HyperLogLog.from_bytes(day_blobs[0])
+        for value_blob, day_blob in zip(value_blobs[1:], day_blobs[1:]):
+            value_sketch.merge(QuantileSketch.from_bytes(value_blob))
+            day_sketch.merge(HyperLogLog.from_bytes(day_blob))
+        percentiles.append(value_sketch.quantile(SKETCH_PERCENTILES))
+        day_counts.append(day_sketch.count())
+        # Single-shard ids keep their original bytes untouched
+        value_sketches.append(value_sketch.to_bytes() if len(value_blobs) > 1 else value_blobs[0])
+        day_sketches.append(day_sketch.to_bytes() if len(day_blobs) > 1 else day_blobs[0])
+
+    percentile_values = np.asarray(percentiles).reshape(len(merged), len(SKETCH_PERCENTILES))
+    for i, col in enumerate(_percentile_columns()):
+        merged[col] = percentile_values[:, i]
+    merged['value_sketch'] = value_sketches
+    merged['distinct_active_days'] = np.round(day_counts).astype('int64')
+    merged['active_days_sketch'] = day_sketches
+    merged['high_value'] = merged['sum_value'] > threshold
+    merged['kpi_generated_at'] = datetime.utcnow()
+
+    logger.info("Merged %s Gold rows into %s ids.", len(combined), len(merged))
+    return merged[list(combined.columns)]
+
+
+WINDOW_PARTIAL_COLUMNS = ['id', 'bucket', 'count', 'sum_value']
+
+
+def compute_window_partials(silver_df: pd.DataFrame, freq: str = 'D') -> pd.DataFrame:
+    """
+    Aggregates silver rows into per-(id, bucket) partials.
+
+    Parameters:
+        silver_df (pd.DataFrame): Silver data with 'id', 'date' and 'value'.
+        freq (str): Bucket size as a pandas period alias ('D', 'W' or 'M').
+
+    Returns:
+        pd.DataFrame: One row per (id, bucket) with 'count' and 'sum_value';
+        'bucket' is the period start timestamp.
+    """
+    missing = {'id', 'date', 'value'} - set(silver_df.columns)
+    if silver_df.empty or missing:
+        if missing:
+            logger.error("Columns %s not found in silver_df. Cannot build window partials.", sorted(missing))
+        return pd.DataFrame(columns=WINDOW_PARTIAL_COLUMNS)
+
+    dates = pd.to_datetime(silver_df['date'], errors='coerce')
+    valid = dates.notna() & silver_df['id'].notna()
+    if not valid.all():
+        logger.warning("Skipping %s rows with missing 'id' or 'date' in window partials.", int((~valid).sum()))
+
+    frame = pd.DataFrame({
+        'id': silver_df.loc[valid, 'id'].astype(str),
+        'bucket': dates[valid].dt.to_period(freq).dt.start_time,
+        'value': pd.to_numeric(silver_df.loc[valid, 'value'], errors='coerce').fillna(0),
+    })
+    return frame.groupby(['id', 'bucket'], sort=True).agg(
+        count=pd.NamedAgg(column='value', aggfunc='size'),
+        sum_value=pd.NamedAgg(column='value', aggfunc='sum'),
+    ).reset_index()
+
+
+def merge_window_partials(existing: pd.DataFrame, new: pd.DataFrame, mode: str = 'add') -> pd.DataFrame:
+    """
+    Applies new per-(id, bucket) partials to previously stored partials.
+
+    Only buckets present in ``new`` change; all other stored buckets are kept.
+
+    Parameters:
+        existing (pd.DataFrame): Stored partials (may be empty).
+        new (pd.DataFrame): Partials computed from the new silver batch.
+        mode (str): 'add' when new rows are increments on top of what was
+            already aggregated (append-only feeds); 'replace' when the batch
+            holds the complete data of every bucket it touches (re-ingestion).
+
+    Returns:
+        pd.DataFrame: Updated partials sorted by (id, bucket).
+    """
+    if mode not in ('add', 'replace'):
+        raise ValueError(f"Unknown window partials mode: {mode}")
+    if existing.empty:
+        return new.sort_values(['id', 'bucket'], ignore_index=True)
+    if new.empty:
+        return existing
+
+    if mode == 'replace':
+        combined = pd.concat([existing, new], ignore_index=True)
+        combined = combined.drop_duplicates(subset=['id', 'bucket'], keep='last')
+    else:
+        combined = pd.concat([existing, new], ignore_index=True).groupby(
+            ['id', 'bucket'], sort=False
+        )[['count', 'sum_value']].sum().reset_index()
+    return combined.sort_values(['id', 'bucket'], ignore_index=True)
+
+
+def compute_trailing_windows(
+    partials: pd.DataFrame, windows: Sequence[int] = (7, 30), freq: str = 'D'
+) -> pd.DataFrame:
+    """
+    Derives trailing-window KPIs from per-(id, bucket) partials.
+
+    For each bucket b of an id, trailing_<N><freq>_count / _sum_value cover
+    the buckets in (b - N, b]. Computed with one cumulative sum per metric and
+    a binary search for the window start, without any per-id loop.
+
+    Parameters:
+        partials (pd.DataFrame): Output of ``merge_window_partials``.
+        windows (Sequence[int]): Window lengths, in buckets.
+        freq (str): Bucket size used for the partials.
+
+    Returns:
+        pd.DataFrame: Partials plus trailing window columns and 'kpi_generated_at'.
+    """
+    result = partials.sort_values(['id', 'bucket'], ignore_index=True)
+    if result.empty:
+        return result
+
+    ordinal = pd.PeriodIndex(result['bucket'], freq=freq).asi8
+    ordinal = ordinal - ordinal.min()
+    id_codes = pd.factorize(result['id'], sort=True)[0]
+    # Ids occupy disjoint key ranges, so a window start never crosses into another id
+    stride = int(ordinal.max()) + max(windows) + 1
+    key = id_codes.astype(np.int64) * stride + ordinal
+
+    for metric in ('count', 'sum_value'):
+        cumulative = np.concatenate([[0], np.cumsum(result[metric].to_numpy())])
+        for window in windows:
+            start = np.searchsorted(key, key - window, side='right')
+            result[f"trailing_{window}{freq.lower()}_{metric}"] = cumulative[1:] - cumulative[start]
+
+    result['kpi_generated_at'] = datetime.utcnow()
+    return result
+
+
+def aggregate_windows(
+    silver_df: pd.DataFrame,
+    gold_path: str,
+    freq: str = 'D',
+    windows: Sequence[int] = (7, 30),
+    mode: str = 'replace',
+) -> pd.DataFrame:
+    """
+    Incrementally maintains the windowed Gold table for a new silver batch.
+
+    Stored partials (``window_partials_<freq>.parquet``) are updated only for
+    the (id, bucket) pairs present in silver_df, then trailing windows are
+    derived from the partials and written to ``gold_windows_<freq>.parquet``.
+    Silver history is never rescanned.
+
+    Parameters:
+        silver_df (pd.DataFrame): New silver batch.
+        gold_path (str): Gold layer directory.
+        freq (str): Bucket size ('D', 'W' or 'M').
+        windows (Sequence[int]): Trailing window lengths, in buckets.
+        mode (str): How new partials combine with stored ones: 'replace' (default,
+            each run re-ingests its buckets in full, as run_pipeline does) or
+            'add' (append-only batches).
+
+    Returns:
+        pd.DataFrame: The windowed Gold table.
+    """
+    gold_dir = Path(gold_path)
+    gold_dir.mkdir(parents=True, exist_ok=True)
+    partials_file = gold_dir / f"window_partials_{freq.lower()}.parquet"
+    output_file = gold_dir / f"gold_windows_{freq.lower()}.parquet"
+
+    existing = pd.read_parquet(partials_file) if partials_file.exists() else pd.DataFrame(columns=WINDOW_PARTIAL_COLUMNS)
+    new = compute_window_partials(silver_df, freq=freq)
+    partials = merge_window_partials(existing, new, mode=mode)
+    partials.to_parquet(partials_file, index=False)
+    logger.info("Updated %s window buckets (%s stored) in %s.", len(new), len(partials), partials_file)
+
+    windowed = compute_trailing_windows(partials, windows=windows, freq=freq)
+    windowed.to_parquet(output_file, index=False)
+    logger.info("Saved windowed Gold data to %s with %s records.", output_file, len(windowed))
+    return windowed
@@ -0,0 +1,514 @@
+# src/sketches.py
+
+"""
+Mergeable streaming sketches used by profiling and Gold KPIs.
+
+Includes:
+- QuantileSketch: KLL-style quantile summary (approximate percentiles)
+- HyperLogLog: approximate distinct counts
+
+Both sketches ingest whole numpy/pandas batches at once, can be merged across
+chunks, worker processes and pipeline runs, and serialize to JSON-friendly dicts
+or compact bytes.
+"""
+
+import base64
+import math
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_timedelta64_dtype,
+)
+
+ArrayLike = Union[np.ndarray, pd.Series, List[Any]]
+
+
+class QuantileSketch:
+    """
+    KLL-style quantile sketch over numeric values.
+
+    Items live in a stack of compactors; an item at level h stands for 2**h
+    input values. When a level overflows it is sorted and every other item
+    (random offset) is promoted, so memory stays O(k) regardless of input size.
+
+    Error bound: the normalized rank error of a single quantile query is about
+    1.65% for k=200 (99% confidence) and scales roughly as 1/k. Inputs with at
+    most k values are kept exactly and queried with linear interpolation, like
+    ``Series.quantile``. min and max are always exact.
+
+    Args:
+        k (int): Accuracy/size parameter (top-level compactor capacity).
+        seed (int, optional): Seed for the compaction coin flips.
+    """
+
+    _C = 2.0 / 3.0
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.n = 0
+        self.min = math.nan
+        self.max = math.nan
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(int(math.ceil(self.k * self._C**depth)), 2)
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                # Odd leftover stays behind so total weight is preserved
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[: len(items) - len(keep)]
+                promoted = pairs[int(self._rng.integers(2)) :: 2]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = keep
+                # Adding a level shrinks lower capacities, so re-check from the bottom
+                level = 0
+                continue
+            level += 1
+
+    def update(self, values: ArrayLike) -> "QuantileSketch":
+        """
+        Adds a batch of values; NaN/None are ignored.
+
+        Args:
+            values: Array-like of numeric values.
+
+        Returns:
+            QuantileSketch: self, for chaining.
+        """
+        arr = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        arr = arr[~np.isnan(arr)]
+        if arr.size == 0:
+            return self
+        self.n += int(arr.size)
+        self.min = float(np.nanmin([self.min, arr.min()]))
+        self.max = float(np.nanmax([self.max, arr.max()]))
+        self.levels[0] = np.concatenate([self.levels[0], arr])
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merges another sketch into this one in place.
+
+        Args:
+            other (QuantileSketch): Sketch built over a disjoint set of values.
+
+        Returns:
+            QuantileSketch: self, for chaining.
+        """
+        if other.n == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = float(np.nanmin([self.min, other.min]))
+        self.max = float(np.nanmax([self.max, other.max]))
+        self._compress()
+        return self
+
+    def _weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lvl), 2.0**h) for h, lvl in enumerate(self.levels)])
+        order = np.argsort(items, kind='mergesort')
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+        """
+        Returns approximate quantile(s) for q in [0, 1].
+
+        Args:
+            q (float | Iterable[float]): Quantile or quantiles to query.
+
+        Returns:
+            float | np.ndarray: Estimated values (NaN when the sketch is empty).
+        """
+        q_array = np.asarray(q, dtype=np.float64)
+        qs = np.atleast_1d(q_array)
+        if self.n == 0:
+            result = np.full(qs.shape, np.nan)
+        elif len(self.levels) == 1:
+            result = np.quantile(self.levels[0], np.clip(qs, 0, 1))
+        else:
+            items, cum = self._weighted_items()
+            idx = np.searchsorted(cum, qs * cum[-1], side='left')
+            result = items[np.clip(idx, 0, len(items) - 1)]
+            result = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, result))
+        return float(result[0]) if q_array.ndim == 0 else result
+
+    def cdf(self, split_points: ArrayLike) -> np.ndarray:
+        """
+        Returns the approximate fraction of values <= each split point.
+
+        Args:
+            split_points: Monotonic array of values.
+
+        Returns:
+            np.ndarray: Cumulative fractions in [0, 1].
+        """
+        points = np.asarray(split_points, dtype=np.float64)
+        if self.n == 0:
+            return np.zeros(points.shape)
+        items, cum = self._weighted_items()
+        idx = np.searchsorted(items, points, side='right')
+        return np.where(idx > 0, cum[np.maximum(idx - 1, 0)], 0.0) / cum[-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON-serializable representation."""
+        return {
+            "k": self.k,
+            "n": self.n,
+            "min": None if math.isnan(self.min) else self.min,
+            "max": None if math.isnan(self.max) else self.max,
+            "levels": [lvl.tolist() for lvl in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Rebuilds a sketch from ``to_dict`` output."""
+        sketch = cls(k=data["k"])
+        sketch.n = data["n"]
+        sketch.min = math.nan if data["min"] is None else data["min"]
+        sketch.max = math.nan if data["max"] is None else data["max"]
+        sketch.levels = [np.asarray(lvl, dtype=np.float64) for lvl in data["levels"]]
+        return sketch
+
+    def to_bytes(self) -> bytes:
+        """Returns a compact binary representation (for Parquet binary columns)."""
+        sizes = [len(lvl) for lvl in self.levels]
+        header = struct.pack(
+            f"<iqddi{len(sizes)}i", self.k, self.n, self.min, self.max, len(sizes), *sizes
+        )
+        return header + np.concatenate(self.levels).astype('<f8').tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "QuantileSketch":
+        """Rebuilds a sketch from ``to_bytes`` output."""
+        k, n, vmin, vmax, num_levels = struct.unpack_from("<iqddi", data)
+        offset = struct.calcsize("<iqddi")
+        sizes = struct.unpack_from(f"<{num_levels}i", data, offset)
+        offset += 4 * num_levels
+        items = np.frombuffer(data, dtype='<f8', offset=offset).astype(np.float64)
+        sketch = cls(k=k)
+        sketch.n, sketch.min, sketch.max = n, vmin, vmax
+        sketch.levels = np.split(items, np.cumsum(sizes)[:-1]) if sizes else [items]
+        return sketch
+
+
+def hash_values(values: ArrayLike) -> np.ndarray:
+    """
+    Hashes values to uint64 deterministically across processes and runs.
+
+    Nulls are dropped before hashing. Numbers are hashed as float64, so a
+    value hashes the same from an int column and from a float column (e.g.
+    an int column that became float because a chunk had a null). Datetimes
+    and timedeltas are hashed at nanosecond resolution (tz-aware ones as UTC
+    instants), so the hash does not depend on the column's time unit.
+
+    Args:
+        values: Array-like of any hashable scalar type.
+
+    Returns:
+        np.ndarray: uint64 hashes.
+    """
+    series = pd.Series(values).dropna()
+    if is_numeric_dtype(series) and not is_bool_dtype(series):
+        series = series.astype(np.float64) + 0.0  # + 0.0 folds -0.0 into 0.0
+    elif is_datetime64_any_dtype(series):
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            series = series.dt.tz_convert(None)
+        series = series.astype("datetime64[ns]")
+    elif is_timedelta64_dtype(series):
+        series = series.astype("timedelta64[ns]")
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def _leading_zeros64(x: np.ndarray) -> np.ndarray:
+    """Vectorized count of leading zero bits in uint64 values."""
+    x = x.astype(np.uint64, copy=True)
+    zeros = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        empty = (x >> np.uint64(64 - shift)) == 0
+        zeros += empty * shift
+        x = np.where(empty, x << np.uint64(shift), x)
+    zeros += (x == 0).astype(np.int64)
+    return zeros
+
+
+def hll_index_rank(hashes: np.ndarray, p: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Splits 64-bit hashes into HyperLogLog register indices and ranks.
+
+    Args:
+        hashes (np.ndarray): uint64 hashes from ``hash_values``.
+        p (int): Precision (number of index bits).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: register index and rank per hash.
+    """
+    index = (hashes >> np.uint64(64 - p)).astype(np.int64)
+    remainder = hashes << np.uint64(p)
+    rank = np.minimum(_leading_zeros64(remainder) + 1, 64 - p + 1).astype(np.uint8)
+    return index, rank
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count sketch with 2**p one-byte registers.
+
+    Error bound: relative standard error is 1.04 / sqrt(2**p), e.g. ~1.6% for
+    p=12 and ~3.3% for p=10. Small cardinalities use linear counting and are
+    close to exact. Merging is a register-wise max, so it is lossless.
+
+    Args:
+        p (int): Precision, between 4 and 16.
+    """
+
+    def __init__(self, p: int = 12) -> None:
+        if not 4 <= p <= 16:
+            raise ValueError("p must be between 4 and 16")
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of ``count``."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, values: ArrayLike) -> "HyperLogLog":
+        """
+        Adds a batch of values; nulls are ignored.
+
+        Returns:
+            HyperLogLog: self, for chaining.
+        """
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> "HyperLogLog":
+        """Adds a batch of precomputed ``hash_values`` output."""
+        if hashes.size:
+            index, rank = hll_index_rank(hashes, self.p)
+            np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Merges another sketch with the same precision in place."""
+        if other.p != self.p:
+            raise ValueError(f"Cannot merge HyperLogLog with p={other.p} into p={self.p}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> float:
+        """Returns the estimated number of distinct values."""
+        return hll_estimate(self.registers[np.newaxis, :])[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON-serializable representation."""
+        return {
+            "p": self.p,
+            "registers": base64.b64encode(self.registers.tobytes()).decode('ascii'),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HyperLogLog":
+        """Rebuilds a sketch from ``to_dict`` output."""
+        sketch = cls(p=data["p"])
+        sketch.registers = np.frombuffer(base64.b64decode(data["registers"]), dtype=np.uint8).copy()
+        return sketch
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns a compact binary representation (for Parquet binary columns).
+
+        Sketches with few non-zero registers are stored sparsely as
+        (uint16 index, uint8 rank) pairs; others as the dense register array.
+        """
+        index = np.flatnonzero(self.registers)
+        return _hll_bytes(self.p, index, self.registers[index])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        """Rebuilds a sketch from ``to_bytes`` output."""
+        p, kind = data[0], data[1]
+        sketch = cls(p=p)
+        if kind == _HLL_DENSE:
+            sketch.registers = np.frombuffer(data, dtype=np.uint8, offset=2).copy()
+        else:
+            nnz = (len(data) - 2) // 3
+            index = np.frombuffer(data, dtype='<u2', count=nnz, offset=2)
+            sketch.registers[index] = np.frombuffer(data, dtype=np.uint8, offset=2 + 2 * nnz)
+        return sketch
+
+
+_HLL_DENSE, _HLL_SPARSE = 0, 1
+
+
+def _hll_bytes(p: int, index: np.ndarray, rank: np.ndarray) -> bytes:
+    """Serializes non-zero registers, choosing the smaller of sparse and dense."""
+    m = 1 << p
+    if 3 * len(index) < m:
+        return (
+            bytes([p, _HLL_SPARSE])
+            + index.astype('<u2').tobytes()
+            + rank.astype(np.uint8).tobytes()
+        )
+    registers = np.zeros(m, dtype=np.uint8)
+    registers[index] = rank
+    return bytes([p, _HLL_DENSE]) + registers.tobytes()
+
+
+def _hll_estimate_from_sums(inverse_sum: np.ndarray, zeros: np.ndarray, m: int) -> np.ndarray:
+    alpha = 0.7213 / (1 + 1.079 / m) if m >= 128 else {16: 0.673, 32: 0.697, 64: 0.709}[m]
+    raw = alpha * m * m / inverse_sum
+    with np.errstate(divide='ignore'):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+    return np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+
+
+def hll_estimate(registers: np.ndarray) -> np.ndarray:
+    """
+    Vectorized HyperLogLog estimate for a 2-D array of register rows.
+
+    Args:
+        registers (np.ndarray): Shape (n_sketches, 2**p) uint8 registers.
+
+    Returns:
+        np.ndarray: Estimated distinct count per row.
+    """
+    inverse_sum = np.sum(np.exp2(-registers.astype(np.float64)), axis=1)
+    zeros = np.count_nonzero(registers == 0, axis=1)
+    return _hll_estimate_from_sums(inverse_sum, zeros, registers.shape[1])
+
+
+def grouped_quantile_sketches(
+    codes: np.ndarray,
+    values: np.ndarray,
+    n_groups: int,
+    k: int = 200,
+    qs: Iterable[float] = (0.5, 0.95),
+) -> Tuple[List[bytes], np.ndarray]:
+    """
+    Builds one QuantileSketch per group from a single sorted batch.
+
+    Values are sorted once by (group, value). Groups with at most k values,
+    the common case for per-customer KPIs, are serialized and queried directly
+    from the sorted array (exact, linear interpolation); only larger groups go
+    through compaction.
+
+    Args:
+        codes (np.ndarray): Group code per row, in [0, n_groups).
+        values (np.ndarray): Numeric value per row; NaN is ignored.
+        n_groups (int): Number of groups.
+        k (int): Sketch accuracy parameter.
+        qs (Iterable[float]): Quantiles to evaluate per group.
+
+    Returns:
+        Tuple[List[bytes], np.ndarray]: Serialized sketch per group and an
+        (n_groups, len(qs)) array of quantile estimates.
+    """
+    qs = np.asarray(list(qs), dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    keep = ~np.isnan(values)
+    codes, values = np.asarray(codes)[keep], values[keep]
+    order = np.lexsort((values, codes))
+    codes, values = codes[order], values[order]
+
+    sizes = np.bincount(codes, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    # Exact quantiles for small groups, interpolating between neighbouring ranks
+    position = qs[np.newaxis, :] * np.maximum(sizes[:, np.newaxis] - 1, 0)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    last = max(len(values) - 1, 0)
+    if len(values):
+        low_values = values[np.minimum(starts[:, np.newaxis] + lower, last)]
+        high_values = values[np.minimum(starts[:, np.newaxis] + upper, last)]
+        result = low_values + (high_values - low_values) * (position - lower)
+    else:
+        result = np.full((n_groups, len(qs)), np.nan)
+    result = np.where(sizes[:, np.newaxis] > 0, result, np.nan)
+
+    sketches: List[bytes] = []
+    empty = QuantileSketch(k=k)
+    for group in range(n_groups):
+        size = sizes[group]
+        chunk = values[starts[group] : starts[group] + size]
+        if size == 0:
+            sketches.append(empty.to_bytes())
+        elif size <= k:
+            header = struct.pack("<iqddii", k, size, chunk[0], chunk[-1], 1, size)
+            sketches.append(header + chunk.astype('<f8').tobytes())
+        else:
+            sketch = QuantileSketch(k=k).update(chunk)
+            sketches.append(sketch.to_bytes())
+            result[group] = sketch.quantile(qs)
+    return sketches, result
+
+
+def grouped_hyperloglogs(
+    codes: np.ndarray, values: ArrayLike, n_groups: int, p: int = 10
+) -> Tuple[List[bytes], np.ndarray]:
+    """
+    Builds one HyperLogLog per group in a single vectorized pass.
+
+    Hashing, register-max reduction and estimation run over all rows at once
+    on the sparse (group, register) entries, so no dense per-group register
+    array is materialized; sketches serialize sparsely when that is smaller.
+
+    Args:
+        codes (np.ndarray): Group code per row, in [0, n_groups).
+        values: Values to count distinct per group; nulls are ignored.
+        n_groups (int): Number of groups.
+        p (int): HyperLogLog precision.
+
+    Returns:
+        Tuple[List[bytes], np.ndarray]: Serialized sketch per group and the
+        estimated distinct count per group.
+    """
+    series = pd.Series(values).reset_index(drop=True)
+    valid = series.notna().to_numpy()
+    codes = np.asarray(codes, dtype=np.int64)[valid]
+    index, rank = hll_index_rank(hash_values(series[valid]), p)
+    m = 1 << p
+
+    # Keep the max rank per (group, register): sort by key then rank, take the last
+    key = codes * m + index
+    order = np.lexsort((rank, key))
+    key, rank = key[order], rank[order]
+    last = np.ones(len(key), dtype=bool)
+    last[:-1] = key[1:] != key[:-1]
+    key, rank = key[last], rank[last]
+    group, index = key // m, key % m
+
+    nnz = np.bincount(group, minlength=n_groups)
+    inverse_sum = (m - nnz) + np.bincount(
+        group, weights=np.exp2(-rank.astype(np.float64)), minlength=n_groups
+    )
+    counts = _hll_estimate_from_sums(inverse_sum, m - nnz, m)
+
+    bounds = np.concatenate([[0], np.cumsum(nnz)])
+    sketches = [
+        _hll_bytes(p, index[bounds[g] : bounds[g + 1]], rank[bounds[g] : bounds[g + 1]])
+        for g in range(n_groups)
+    ]
+    return sketches, counts
@@ -1,8 +1,15 @@
 import os
+import json
+import time
+import queue
+import atexit
+import threading
+import multiprocessing
 import yaml
 import logging
 import logging.config
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple, Union
 import pandas as pd
 
 
@@ -31,30 +38,267 @@ def load_config(config_path: str) -> Dict[str, Any]:
     return config
 
 
-def setup_logging(default_path: str = 'configs/logging.yaml', default_level: int = logging.INFO) -> None:
+class JsonFormatter(logging.Formatter):
+    """
+    Formats log records as single-line JSON objects for log shippers.
+
+    Emits timestamp, level, logger name and the rendered message, plus any
+    extra attributes passed via ``extra=`` that are JSON serializable.
+    """
+
+    _RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key in self._RESERVED or key.startswith("_"):
+                continue
+            if isinstance(value, (str, int, float, bool)) or value is None:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drops repeats of the same message template beyond ``rate`` per ``per_seconds``.
+
+    Records are keyed by logger name and the unformatted message template, so
+    per-file and per-chunk messages logged with %-style arguments share one
+    budget. The first record let through after a suppression window carries a
+    ``suppressed`` count so dropped messages are still accounted for.
+
+    Args:
+        rate (int): Maximum records per key within one window.
+        per_seconds (float): Window length in seconds.
+    """
+
+    def __init__(self, rate: int = 20, per_seconds: float = 10.0) -> None:
+        super().__init__()
+        self.rate = rate
+        self.per_seconds = per_seconds
+        self._windows: Dict[Tuple[str, str], List[float]] = {}  # start, emitted, suppressed
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(key, [now, 0, 0])
+            if now - window[0] >= self.per_seconds:
+                suppressed = int(window[2])
+                window[0], window[1], window[2] = now, 0, 0
+                if suppressed and not isinstance(record.args, dict):
+                    record.suppressed = suppressed
+                    record.msg = f"{record.msg} [%d similar messages suppressed]"
+                    record.args = tuple(record.args or ()) + (suppressed,)
+            if window[1] >= self.rate:
+                window[2] += 1
+                return False
+            window[1] += 1
+        return True
+
+
+_log_queue: Optional[Any] = None
+_queue_listener: Optional[QueueListener] = None
+_listener_pid: Optional[int] = None
+_queued_loggers: List[Tuple[logging.Logger, List[logging.Handler]]] = []
+
+
+def _to_level(level: Union[int, str]) -> int:
+    if isinstance(level, str):
+        return getattr(logging, level.upper(), logging.INFO)
+    return level
+
+
+def setup_logging(
+    default_path: str = 'configs/logging.yaml',
+    default_level: Optional[Union[int, str]] = None,
+    use_queue: bool = True,
+    json_format: bool = False,
+    rate_limit: Optional[int] = 20,
+    multiprocess: bool = False,
+    log_file: Optional[str] = None,
+) -> Optional[QueueListener]:
     """
     Setup logging configuration from YAML file or fallback to basic config.
 
+    With ``use_queue`` enabled, the configured file/console handlers are moved
+    behind a ``QueueListener`` thread and every configured logger gets a single
+    ``QueueHandler`` instead, so callers only pay for an enqueue and never block
+    on disk or stdout writes.
+
     Args:
         default_path (str): Path to logging config YAML.
-        default_level (int): Default logging level if YAML is missing.
+        default_level (int | str, optional): Level for the root logger and the
+            loggers configured in the YAML, overriding their YAML levels.
+            None keeps the YAML levels (INFO if the YAML is missing).
+        use_queue (bool): Route records through a background QueueListener.
+        json_format (bool): Format every handler's output as JSON lines.
+        rate_limit (int, optional): Max repeats of one message template per 10s
+            window (INFO and below). None disables rate limiting.
+        multiprocess (bool): Use a multiprocessing queue so worker processes can
+            log through ``init_worker_logging(get_log_queue())``.
+        log_file (str, optional): Override the filename of the YAML 'file'
+            handler (or the fallback log file).
+
+    Returns:
+        QueueListener | None: The started listener when ``use_queue`` is set.
     """
+    stop_logging()
+    level = _to_level(default_level if default_level is not None else logging.INFO)
+
     if os.path.exists(default_path):
         with open(default_path, 'rt') as f:
             config = yaml.safe_load(f)
+        if log_file and "file" in config.get("handlers", {}):
+            config["handlers"]["file"]["filename"] = log_file
+        for handler in config.get("handlers", {}).values():
+            filename = handler.get("filename")
+            if filename:
+                os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
         logging.config.dictConfig(config)
+        logger_names = [""] + list(config.get("loggers", {}))
+        if default_level is not None:
+            for name in logger_names:
+                logging.getLogger(name).setLevel(level)
     else:
-        log_dir = "./logs"
-        os.makedirs(log_dir, exist_ok=True)
+        log_path = log_file or os.path.join("./logs", "pipeline.log")
+        os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
 
         logging.basicConfig(
-            level=default_level,
+            level=level,
             format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
             handlers=[
-                logging.FileHandler(os.path.join(log_dir, "pipeline.log")),
+                logging.FileHandler(log_path),
                 logging.StreamHandler()
-            ]
+            ],
+            force=True,
         )
+        logger_names = [""]
+
+    loggers = [logging.getLogger(name) for name in logger_names]
+    handlers: List[logging.Handler] = []
+    for lg in loggers:
+        for handler in lg.handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+
+    if json_format:
+        for handler in handlers:
+            handler.setFormatter(JsonFormatter())
+
+    if not use_queue:
+        if rate_limit:
+            limiter = RateLimitFilter(rate=int(rate_limit))
+            for handler in handlers:
+                handler.addFilter(limiter)
+        return None
+
+    global _log_queue, _queue_listener, _listener_pid
+    _log_queue = multiprocessing.Queue(-1) if multiprocess else queue.SimpleQueue()
+    queue_handler = QueueHandler(_log_queue)
+    if rate_limit:
+        queue_handler.addFilter(RateLimitFilter(rate=int(rate_limit)))
+    for lg in loggers:
+        _queued_loggers.append((lg, list(lg.handlers)))
+        for handler in list(lg.handlers):
+            lg.removeHandler(handler)
+        lg.addHandler(queue_handler)
+
+    _queue_listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    _listener_pid = os.getpid()
+    return _queue_listener
+
+
+def get_log_queue() -> Optional[Any]:
+    """
+    Return the queue behind the active QueueListener, if any.
+
+    Pass it to ``init_worker_logging`` (e.g. as a pool ``initializer`` argument)
+    when ``setup_logging`` was called with ``multiprocess=True``.
+    """
+    return _log_queue
+
+
+def init_worker_logging(log_queue: Any, log_level: Union[int, str] = logging.INFO) -> None:
+    """
+    Route all logging in a worker process to the parent's QueueListener.
+
+    Intended as a ``ProcessPoolExecutor``/``Pool`` initializer. Replaces any
+    handlers inherited from the parent so the worker never writes to the
+    log file or stdout directly.
+
+    Args:
+        log_queue: Queue returned by ``get_log_queue`` in the parent.
+        log_level (int | str): Root level in the worker.
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(_to_level(log_level))
+
+    # Module loggers configured with propagate: no keep their own handlers
+    for lg in logging.root.manager.loggerDict.values():
+        if isinstance(lg, logging.Logger) and lg.handlers and not lg.propagate:
+            for handler in list(lg.handlers):
+                lg.removeHandler(handler)
+            lg.propagate = True
+
+
+def stop_logging() -> None:
+    """
+    Flush and stop the active QueueListener, if any.
+
+    The original handlers are re-attached to their loggers so logging keeps
+    working synchronously afterwards. Safe to call more than once, and in a
+    forked child, where only the references are dropped; also registered to
+    run at interpreter exit.
+    """
+    global _log_queue, _queue_listener
+    if _queue_listener is not None:
+        # A forked child has the listener object but not its thread; stopping it
+        # there would put the stop sentinel on a queue shared with the parent
+        if _listener_pid == os.getpid():
+            _queue_listener.stop()
+        _queue_listener = None
+    for lg, handlers in _queued_loggers:
+        for handler in list(lg.handlers):
+            if isinstance(handler, QueueHandler):
+                lg.removeHandler(handler)
+        for handler in handlers:
+            lg.addHandler(handler)
+    _queued_loggers.clear()
+    _log_queue = None
+
+
+def _restore_handlers_after_fork() -> None:
+    """
+    In a forked child, swap an in-process log queue back for direct handlers.
+
+    The child inherits the QueueHandler but not the listener thread, so records
+    put on a ``queue.SimpleQueue`` would never be written. A multiprocessing
+    queue is kept: the parent's listener still drains it.
+    """
+    if _queue_listener is None or not isinstance(_log_queue, queue.SimpleQueue):
+        return
+    stop_logging()
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restore_handlers_after_fork)
 
 
 def init_logging(log_level: str = "INFO") -> None:
@@ -90,11 +334,11 @@ def validate_schema(df: pd.DataFrame, schema: Dict[str, Any]) -> bool:
     columns = schema.get("columns", {})
     for col_name, props in columns.items():
         if col_name not in df.columns:
-            logging.error(f"Missing required column: {col_name}")
+            logging.error("Missing required column: %s", col_name)
             return False
 
         if not props.get("nullable", True) and df[col_name].isnull().any():
-            logging.error(f"Non-nullable column '{col_name}' contains null values.")
+            logging.error("Non-nullable column '%s' contains null values.", col_name)
             return False
 
         expected_type = props.get("type")
@@ -109,7 +353,7 @@ def validate_schema(df: pd.DataFrame, schema: Dict[str, Any]) -> bool:
                 elif expected_type == "string":
                     df[col_name] = df[col_name].astype(str)
             except Exception as e:
-                logging.error(f"Type coercion failed for column '{col_name}': {e}")
+                logging.error("Type coercion failed for column '%s': %s", col_name, e)
                 return False
 
     return True
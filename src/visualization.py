@@ -8,6 +8,9 @@ Includes:
 - Null value bar chart
 - Histogram distributions
 
+Heatmap, null chart and histogram can draw from a precomputed DataProfile
+(see src/profiling.py) instead of rescanning the data.
+
 Author: Senior Data Engineer
 """
 
@@ -15,21 +18,27 @@ import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 from pathlib import Path
+from typing import Optional
 import logging
 
+from src.profiling import DataProfile, profile_dataframe
+
 logger = logging.getLogger(__name__)
 
-def plot_correlation_heatmap(df: pd.DataFrame, output_path: str = None) -> None:
+def plot_correlation_heatmap(
+    df: pd.DataFrame, output_path: str = None, profile: Optional[DataProfile] = None
+) -> None:
     """
     Plots and saves a correlation heatmap of numeric features.
 
     Args:
-        df (pd.DataFrame): Input dataframe.
+        df (pd.DataFrame): Input dataframe. Ignored when profile is given.
         output_path (str, optional): Path to save the plot image. If None, plot is not saved.
+        profile (DataProfile, optional): Precomputed profile to take correlations from.
     """
     try:
         plt.figure(figsize=(10, 8))
-        corr = df.corr()
+        corr = profile.correlation() if profile is not None else df.corr()
         sns.heatmap(corr, annot=True, fmt=".2f", cmap="coolwarm", cbar=True)
         plt.title("Correlation Heatmap")
         plt.tight_layout()
@@ -37,11 +46,11 @@ def plot_correlation_heatmap(df: pd.DataFrame, output_path: str = None) -> None:
         if output_path:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             plt.savefig(output_path)
-            logger.info(f"Saved correlation heatmap to {output_path}")
+            logger.info("Saved correlation heatmap to %s", output_path)
 
         plt.close()
     except Exception as e:
-        logger.error(f"Error generating correlation heatmap: {e}")
+        logger.error("Error generating correlation heatmap: %s", e)
 
 def plot_time_series(df: pd.DataFrame, date_col: str, value_col: str, group_col: str = None, output_path: str = None) -> None:
     """
@@ -67,22 +76,25 @@ def plot_time_series(df: pd.DataFrame, date_col: str, value_col: str, group_col:
         if output_path:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             plt.savefig(output_path)
-            logger.info(f"Saved time series plot to {output_path}")
+            logger.info("Saved time series plot to %s", output_path)
 
         plt.close()
     except Exception as e:
-        logger.error(f"Error generating time series plot: {e}")
+        logger.error("Error generating time series plot: %s", e)
 
-def plot_null_values(df: pd.DataFrame, output_path: str = None) -> None:
+def plot_null_values(
+    df: pd.DataFrame, output_path: str = None, profile: Optional[DataProfile] = None
+) -> None:
     """
     Plots and saves a bar chart showing count of null values per column.
 
     Args:
-        df (pd.DataFrame): Input dataframe.
+        df (pd.DataFrame): Input dataframe. Ignored when profile is given.
         output_path (str, optional): Path to save the plot image. If None, plot is not saved.
+        profile (DataProfile, optional): Precomputed profile to take null counts from.
     """
     try:
-        null_counts = df.isnull().sum()
+        null_counts = profile.null_counts() if profile is not None else df.isnull().sum()
         null_counts = null_counts[null_counts > 0].sort_values(ascending=False)
 
         if null_counts.empty:
@@ -99,55 +111,74 @@ def plot_null_values(df: pd.DataFrame, output_path: str = None) -> None:
         if output_path:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             plt.savefig(output_path)
-            logger.info(f"Saved null values plot to {output_path}")
+            logger.info("Saved null values plot to %s", output_path)
 
         plt.close()
     except Exception as e:
-        logger.error(f"Error generating null values plot: {e}")
-
-def plot_histogram(df: pd.DataFrame, col: str, bins: int = 30, output_path: str = None) -> None:
+        logger.error("Error generating null values plot: %s", e)
+
+def plot_histogram(
+    df: pd.DataFrame,
+    col: str,
+    bins: int = 30,
+    output_path: str = None,
+    profile: Optional[DataProfile] = None,
+) -> None:
     """
     Plots and saves a histogram for a single numeric column.
 
     Args:
-        df (pd.DataFrame): Input dataframe.
+        df (pd.DataFrame): Input dataframe. Ignored when profile is given.
         col (str): Column name to plot.
         bins (int, optional): Number of histogram bins. Defaults to 30.
         output_path (str, optional): Path to save the plot image. If None, plot is not saved.
+        profile (DataProfile, optional): Precomputed profile; bins are approximated
+            from the column's quantile sketch.
     """
     try:
         plt.figure(figsize=(8, 5))
-        sns.histplot(df[col].dropna(), bins=bins, kde=True, color="skyblue")
+        if profile is not None:
+            counts = profile.histogram(col, bins=bins)
+            width = counts.index[1] - counts.index[0] if len(counts) > 1 else 1.0
+            plt.bar(counts.index, counts.values, width=width, align='edge', color="skyblue")
+        else:
+            sns.histplot(df[col].dropna(), bins=bins, kde=True, color="skyblue")
         plt.title(f"Distribution of {col}")
         plt.tight_layout()
 
         if output_path:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             plt.savefig(output_path)
-            logger.info(f"Saved histogram plot to {output_path}")
+            logger.info("Saved histogram plot to %s", output_path)
 
         plt.close()
     except Exception as e:
-        logger.error(f"Error generating histogram for {col}: {e}")
+        logger.error("Error generating histogram for %s: %s", col, e)
 
-def generate_visualizations(df: pd.DataFrame, output_dir: str) -> None:
+def generate_visualizations(
+    df: pd.DataFrame, output_dir: str, profile: Optional[DataProfile] = None
+) -> None:
     """
     Helper to generate all key visualizations and save them to output directory.
 
     Args:
         df (pd.DataFrame): Data to visualize.
         output_dir (str): Directory to save plot images.
+        profile (DataProfile, optional): Precomputed profile of df. Built in one
+            pass here when not given.
     """
-    plot_correlation_heatmap(df, output_path=f"{output_dir}/correlation_heatmap.png")
+    if profile is None:
+        profile = profile_dataframe(df)
+    numeric_cols = profile.numeric_columns()
+
+    plot_correlation_heatmap(df, output_path=f"{output_dir}/correlation_heatmap.png", profile=profile)
 
     # Example time series plot (needs 'date' and a numeric column)
-    if 'date' in df.columns:
-        numeric_cols = df.select_dtypes(include='number').columns.tolist()
-        if numeric_cols:
-            plot_time_series(df, date_col='date', value_col=numeric_cols[0], output_path=f"{output_dir}/time_series.png")
+    if 'date' in df.columns and numeric_cols:
+        plot_time_series(df, date_col='date', value_col=numeric_cols[0], output_path=f"{output_dir}/time_series.png")
 
-    plot_null_values(df, output_path=f"{output_dir}/null_values.png")
+    plot_null_values(df, output_path=f"{output_dir}/null_values.png", profile=profile)
 
     # Example histogram for first numeric column
     if numeric_cols:
-        plot_histogram(df, col=numeric_cols[0], output_path=f"{output_dir}/histogram.png")
+        plot_histogram(df, col=numeric_cols[0], output_path=f"{output_dir}/histogram.png", profile=profile)
@@ -0,0 +1,138 @@
+# tests/test_multi_runner.py
+
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+import src.pipeline
+from src.multi_runner import check_isolation, check_memory_limit, expand_config_paths, run_many
+from src.utils import setup_logging, stop_logging
+
+
+def write_dataset(tmp_path, name, rows=True):
+    root = tmp_path / name
+    raw = root / "raw"
+    raw.mkdir(parents=True)
+    if rows:
+        (raw / "data.csv").write_text(
+            "id,name,date,value\n1,Alice,2025-07-01,10\n1,Alice,2025-07-02,20\n2,Bob,2025-07-01,30\n"
+        )
+    config = {
+        "input_path": str(raw),
+        "bronze_path": str(root / "bronze"),
+        "silver_path": str(root / "silver"),
+        "gold_path": str(root / "gold"),
+        "reports_path": str(root / "reports"),
+        "logs_path": str(root / "logs"),
+        "schema": {"columns": {"id": {"type": "string"}, "name": {"type": "string"}}},
+    }
+    config_file = tmp_path / "configs" / f"{name}.yaml"
+    config_file.parent.mkdir(exist_ok=True)
+    config_file.write_text(yaml.safe_dump(config))
+    return config_file
+
+
+def test_expand_config_paths_glob(tmp_path):
+    for name in ["b", "a"]:
+        write_dataset(tmp_path, name)
+    paths = expand_config_paths([str(tmp_path / "configs" / "*.yaml")])
+    assert [p.split("/")[-1] for p in paths] == ["a.yaml", "b.yaml"]
+
+    with pytest.raises(FileNotFoundError):
+        expand_config_paths([str(tmp_path / "missing" / "*.yaml")])
+
+
+def test_check_isolation_rejects_shared_paths():
+    configs = {
+        "a.yaml": {
+            "bronze_path": "data/a/bronze",
+            "silver_path": "data/a/silver",
+            "gold_path": "data/gold",
+        },
+        "b.yaml": {
+            "bronze_path": "data/b/bronze",
+            "silver_path": "data/b/silver",
+            "gold_path": "data/gold",
+        },
+    }
+    with pytest.raises(ValueError, match="gold_path"):
+        check_isolation(configs)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_check_memory_limit_rejects_limit_below_baseline():
+    with pytest.raises(ValueError):
+        check_memory_limit(1)
+    check_memory_limit(None)
+
+
+def test_run_many_isolates_datasets(tmp_path):
+    write_dataset(tmp_path, "tenant_a")
+    write_dataset(tmp_path, "tenant_b")
+    write_dataset(tmp_path, "tenant_empty", rows=False)
+    (tmp_path / "configs" / "tenant_bad.yaml").write_text(
+        "log_level: INFO\nlogs_path: " + str(tmp_path / "bad")
+    )
+    summary_file = tmp_path / "summary.json"
+
+    summary = run_many(
+        [str(tmp_path / "configs" / "*.yaml")], max_workers=2, summary_path=str(summary_file)
+    )
+
+    assert summary["total"] == 4
+    assert summary["succeeded"] == 2
+    assert summary["no_data"] == 1
+    assert summary["failed"] == 1
+    by_name = {result["dataset"]: result for result in summary["datasets"]}
+    assert by_name["tenant_a"]["rows"]["gold"] == 2
+    assert by_name["tenant_a"]["seconds"] > 0
+    assert "KeyError" in by_name["tenant_bad"]["error"]
+    for name in ["tenant_a", "tenant_b"]:
+        assert (tmp_path / name / "gold" / "gold_data.parquet").exists()
+        assert (
+            "Data Pipeline Execution completed"
+            in (tmp_path / name / "logs" / "pipeline.log").read_text()
+        )
+    assert json.loads(summary_file.read_text())["succeeded"] == 2
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="patch is inherited via fork")
+def test_run_many_worker_crash_fails_only_its_dataset(tmp_path, monkeypatch):
+    for name in ["crash", "ok1", "ok2"]:
+        write_dataset(tmp_path, name)
+    run_pipeline = src.pipeline.run_pipeline
+
+    def crash_or_run(config):
+        if Path(config["input_path"]).parent.name == "crash":
+            os._exit(1)
+        time.sleep(0.5)  # still running on the other worker when "crash" dies
+        return run_pipeline(config)
+
+    monkeypatch.setattr(src.pipeline, "run_pipeline", crash_or_run)
+    summary = run_many([str(tmp_path / "configs" / "*.yaml")], max_workers=2)
+
+    by_name = {result["dataset"]: result["status"] for result in summary["datasets"]}
+    assert by_name == {"crash": "failed", "ok1": "success", "ok2": "success"}
+
+
+def test_run_many_keeps_parent_multiprocess_listener(tmp_path):
+    log_file = tmp_path / "parent.log"
+    setup_logging(default_path="missing.yaml", log_file=str(log_file), multiprocess=True)
+    try:
+        write_dataset(tmp_path, "tenant_a")
+        write_dataset(tmp_path, "tenant_b")
+        run_many([str(tmp_path / "configs" / "*.yaml")], max_workers=2)
+        logging.getLogger("tests").info("after the run")
+    finally:
+        stop_logging()
+
+    text = log_file.read_text()
+    assert text.count("Dataset tenant_") == 2
+    assert "Multi-dataset run complete" in text
+    assert "after the run" in text
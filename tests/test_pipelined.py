@@ -0,0 +1,171 @@
+# tests/test_pipelined.py
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import pipelined
+from src.pipeline import run_pipeline
+from src.pipelined import ParquetAppender, run_bronze_silver_pipelined
+
+SCHEMA = {"columns": {"id": {"type": "string"}, "name": {"type": "string"}}}
+
+
+def make_config(tmp_path, name, enabled, **depths):
+    out = tmp_path / name
+    return {
+        "input_path": str(tmp_path / "raw"),
+        "bronze_path": str(out / "bronze"),
+        "silver_path": str(out / "silver"),
+        "gold_path": str(out / "gold"),
+        "reports_path": str(out / "reports"),
+        "schema": SCHEMA,
+        "pipelined": {"enabled": enabled, **depths},
+    }
+
+
+def write_raw(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a.csv").write_text(
+        "id,name,date,value\n1,Alice,2025-07-01,10\n1,Alice,2025-07-01,10\n2,Bob,2025-07-02,20\n"
+    )
+    # Re-delivered row from a.csv, a missing name, and float values
+    (raw / "b.csv").write_text(
+        "id,name,date,value\n1,Alice,2025-07-01,10\n3,,2025-07-03,5\n3,Carol,2025-07-03,7.5\n"
+    )
+    # Extra column: forces a schema change in the streamed Parquet files
+    (raw / "c.csv").write_text("id,name,date,value,region\n4,Dan,2025-07-04,1,EU\n")
+
+
+def test_pipelined_matches_serial(tmp_path):
+    write_raw(tmp_path)
+    serial = run_pipeline(make_config(tmp_path, "serial", False))
+    piped = run_pipeline(make_config(tmp_path, "piped", True, read_ahead=1, write_behind=1))
+
+    assert piped["mode"] == "pipelined"
+    assert piped["rows"] == serial["rows"]
+    assert piped["rows_per_second"] > 0
+    assert piped["pipelined"]["chunks"] == 3
+    assert not piped["pipelined"]["silver_rebuilt"]
+    for layer, file in [("bronze", "bronze_data.parquet"), ("silver", "silver_data.parquet")]:
+        expected = pd.read_parquet(tmp_path / "serial" / layer / file).drop(
+            columns="cleaned_timestamp", errors="ignore"
+        )
+        result = pd.read_parquet(tmp_path / "piped" / layer / file).drop(
+            columns="cleaned_timestamp", errors="ignore"
+        )
+        pd.testing.assert_frame_equal(result, expected)
+    assert (tmp_path / "piped" / "reports" / "silver_profile.json").exists()
+
+
+@pytest.mark.parametrize(
+    "second",
+    [
+        "id,name,date\n3,Carol,2025-07-03\n,Dan,2025-07-04\n",  # null id: pd.concat makes ids float
+        "id,name,date\n3,Carol,07/03/2025\n",  # date format differs from a.csv
+    ],
+)
+def test_pipelined_rebuilds_silver_when_chunk_types_differ(tmp_path, second):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a.csv").write_text("id,name,date\n1,Alice,2025-07-01\n2,Bob,2025-07-02\n")
+    (raw / "b.csv").write_text(second)
+    # Untyped schema: read_csv's per-file inference decides the id dtype
+    configs = [
+        make_config(tmp_path, name, enabled)
+        for name, enabled in [("serial", False), ("piped", True)]
+    ]
+    for config in configs:
+        config["schema"] = {}
+    serial, piped = run_pipeline(configs[0]), run_pipeline(configs[1])
+
+    assert piped["pipelined"]["silver_rebuilt"]
+    assert piped["rows"] == serial["rows"]
+    expected = pd.read_parquet(tmp_path / "serial" / "silver" / "silver_data.parquet").drop(
+        columns="cleaned_timestamp"
+    )
+    result = pd.read_parquet(tmp_path / "piped" / "silver" / "silver_data.parquet").drop(
+        columns="cleaned_timestamp"
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_first_seen_marks_first_occurrence_across_chunks():
+    seen = np.empty(0, dtype=np.uint64)
+    keep, seen = pipelined._first_seen(np.array([5, 3, 5, 9], dtype=np.uint64), seen)
+    assert keep.tolist() == [True, True, False, True]
+    keep, seen = pipelined._first_seen(np.array([9, 1, 1, 10], dtype=np.uint64), seen)
+    assert keep.tolist() == [False, True, False, True]
+    assert seen.tolist() == [1, 3, 5, 9, 10]
+
+
+def test_pipelined_no_data(tmp_path):
+    (tmp_path / "raw").mkdir()
+    summary = run_pipeline(make_config(tmp_path, "piped", True))
+    assert summary["status"] == "no_data"
+
+
+def test_parquet_appender_widens_and_rewrites(tmp_path):
+    path = tmp_path / "out.parquet"
+    sink = ParquetAppender(path)
+    sink.append(pd.DataFrame({"id": ["1"], "value": [1.5]}))
+    sink.append(pd.DataFrame({"value": [2], "id": ["2"]}))  # reordered, int → float cast
+    sink.append(pd.DataFrame({"id": ["3"], "value": [3.0], "extra": ["x"]}))  # rewrite
+    sink.close()
+
+    result = pd.read_parquet(path)
+    assert sink.rows == 3
+    assert list(result.columns) == ["id", "value", "extra"]
+    assert result["value"].tolist() == [1.5, 2.0, 3.0]
+    assert result["extra"].isna().tolist() == [True, True, False]
+
+
+def test_writer_failure_stops_pipeline(tmp_path, monkeypatch):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    for i in range(5):
+        (raw / f"part_{i}.csv").write_text(f"id,name\n{i},Name{i}\n")
+
+    def fail(self, df):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ParquetAppender, "append", fail)
+    with pytest.raises(OSError, match="disk full"):
+        run_bronze_silver_pipelined(
+            make_config(tmp_path, "piped", True), read_ahead=1, write_behind=1
+        )
+
+
+def test_queue_depth_bounds_read_ahead(tmp_path, monkeypatch):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    for i in range(6):
+        (raw / f"part_{i}.csv").write_text(f"id,name\n{i},Name{i}\n")
+
+    waiting = []
+    clean = pipelined.clean_and_standardize
+
+    def slow_clean(df):
+        time.sleep(0.05)  # reader runs ahead until the queue is full
+        waiting.append(stages[0].queue.qsize())
+        return clean(df)
+
+    stages = []
+    stage_cls = pipelined._Stage
+
+    def record_stage(*args):
+        stages.append(stage_cls(*args))
+        return stages[-1]
+
+    monkeypatch.setattr(pipelined, "_Stage", record_stage)
+    monkeypatch.setattr(pipelined, "clean_and_standardize", slow_clean)
+    silver_df, _, stats = run_bronze_silver_pipelined(
+        make_config(tmp_path, "piped", True), read_ahead=2
+    )
+
+    assert len(silver_df) == 6
+    assert stats["read_ahead"] == 2
+    assert max(waiting) == 2
@@ -0,0 +1,88 @@
+# tests/test_profiling.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.profiling import DataProfile, profile_dataframe
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame(
+        {
+            'id': rng.choice(['A', 'B', 'C'], n),
+            'value1': rng.normal(10, 2, n),
+            'value2': rng.normal(size=n),
+            'date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 30, n), unit='D'),
+        }
+    )
+    df['value3'] = df['value1'] * 2 + rng.normal(size=n)
+    df.loc[rng.random(n) < 0.1, 'value2'] = np.nan
+    df.loc[rng.random(n) < 0.2, 'value3'] = np.nan
+    return df
+
+
+def test_profile_matches_full_scan(sample_df):
+    profile = profile_dataframe(sample_df, chunk_size=700)
+    numeric = sample_df.select_dtypes(include='number')
+
+    assert profile.row_count == len(sample_df)
+    assert profile.null_counts().equals(sample_df.isnull().sum())
+    assert np.allclose(profile.correlation().to_numpy(), numeric.corr().to_numpy())
+    assert np.allclose(profile.covariance().to_numpy(), numeric.cov().to_numpy())
+
+    col = profile.columns['value1']
+    assert col.min == sample_df['value1'].min()
+    assert col.max == sample_df['value1'].max()
+    assert abs(col.mean - sample_df['value1'].mean()) < 1e-9
+    assert abs(col.variance - sample_df['value1'].var()) < 1e-9
+    assert profile.columns['date'].min == sample_df['date'].min().isoformat()
+    assert round(profile.columns['id'].distinct.count()) == 3
+
+
+def test_profile_merge_equals_single_pass(sample_df):
+    left = profile_dataframe(sample_df.iloc[:1234])
+    right = profile_dataframe(sample_df.iloc[1234:])
+    merged = left.merge(right)
+    single = profile_dataframe(sample_df)
+
+    assert merged.row_count == single.row_count
+    assert merged.null_counts().equals(single.null_counts())
+    assert np.allclose(merged.correlation().to_numpy(), single.correlation().to_numpy())
+    assert abs(merged.columns['value3'].variance - single.columns['value3'].variance) < 1e-9
+
+
+def test_profile_merge_distinct_is_dtype_stable():
+    ints = DataProfile().update(pd.DataFrame({'v': [1, 2, 3]}))
+    floats = DataProfile().update(pd.DataFrame({'v': [1.0, 2.0, np.nan]}))
+    assert round(ints.merge(floats).columns['v'].distinct.count()) == 3
+
+
+def test_profile_merge_distinct_ignores_datetime_unit():
+    dates = pd.Series(pd.to_datetime(['2025-07-01', '2025-07-02']))
+    ns = DataProfile().update(pd.DataFrame({'d': dates.astype('datetime64[ns]')}))
+    us = DataProfile().update(pd.DataFrame({'d': dates.astype('datetime64[us]')}))
+    utc = DataProfile().update(
+        pd.DataFrame({'d': dates.dt.tz_localize('UTC').dt.tz_convert('Europe/Paris')})
+    )
+    assert round(ns.merge(us).merge(utc).columns['d'].distinct.count()) == 2
+
+
+def test_profile_save_and_load(tmp_path, sample_df):
+    profile = profile_dataframe(sample_df)
+    path = tmp_path / "profile.json"
+    profile.save(str(path))
+
+    loaded = DataProfile.load(str(path))
+    pd.testing.assert_frame_equal(loaded.summary(), profile.summary())
+    pd.testing.assert_frame_equal(loaded.correlation(), profile.correlation())
+
+
+def test_profile_histogram_counts(sample_df):
+    profile = profile_dataframe(sample_df)
+    counts = profile.histogram('value1', bins=10)
+    assert len(counts) == 10
+    assert abs(counts.sum() - len(sample_df)) < 1e-6
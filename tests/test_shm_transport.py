@@ -0,0 +1,66 @@
+# tests/test_shm_transport.py
+
+import gc
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.shm_transport import call_shared, discard, open_frame, receive_frame, share_frame
+
+
+def make_frame(rows):
+    return pd.DataFrame({
+        "id": np.arange(rows) % 7,
+        "name": [f"name_{i % 3}" for i in range(rows)],
+        "value": np.linspace(0, 1, rows),
+        "date": pd.date_range("2025-07-01", periods=rows, freq="h"),
+    })
+
+
+def segment_exists(name):
+    try:
+        shared_memory.SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("rows", [0, 10, 5000])
+def test_roundtrip_from_worker_unlinks_segment(rows):
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        handle = pool.submit(call_shared, make_frame, rows).result()
+
+    assert handle.num_rows == rows
+    assert segment_exists(handle.name)
+
+    result = receive_frame(handle)
+    assert not segment_exists(handle.name)
+    pd.testing.assert_frame_equal(result, make_frame(rows), check_dtype=False)
+
+
+def test_open_frame_is_zero_copy_table_that_outlives_unlink():
+    handle = share_frame(make_frame(100))
+    table = open_frame(handle)
+    assert not segment_exists(handle.name)
+
+    gc.collect()
+    assert table.num_rows == 100
+    assert table.column("value").to_pylist()[-1] == 1.0
+
+
+def test_discard_unlinks_and_is_idempotent():
+    handle = share_frame(make_frame(10))
+    discard(handle)
+    assert not segment_exists(handle.name)
+    discard(handle)
+
+
+def test_handle_pickles_small():
+    handle = share_frame(make_frame(5000))
+    try:
+        assert len(pickle.dumps(handle)) < 200
+    finally:
+        discard(handle)
@@ -2,7 +2,15 @@
 
 import pytest
 import pandas as pd
-from src.silver_to_gold import aggregate_and_enrich
+import numpy as np
+from src.silver_to_gold import (
+    aggregate_and_enrich,
+    aggregate_windows,
+    compute_trailing_windows,
+    compute_window_partials,
+    merge_gold_sketches,
+    merge_window_partials,
+)
 
 def test_aggregate_and_enrich_basic():
     data = {
@@ -60,3 +68,107 @@ def test_aggregate_and_enrich_non_numeric_values():
     # 'invalid' coerced to 0, so sum_value is 10
     assert row['sum_value'] == 10
     assert row['high_value'] == False
+
+def test_aggregate_and_enrich_sketch_columns():
+    data = {
+        'id': ['A', 'A', 'A', 'B', 'B'],
+        'date': ['2025-07-01 08:00', '2025-07-01 17:00', '2025-07-02 09:00', '2025-07-01 10:00', None],
+        'value': [10, 20, 30, 40, 50]
+    }
+    result = aggregate_and_enrich(pd.DataFrame(data), sketches=True)
+
+    row_a = result[result['id'] == 'A'].iloc[0]
+    assert row_a['p50_value'] == 20
+    assert abs(row_a['p95_value'] - 29) < 1e-6
+    assert row_a['distinct_active_days'] == 2
+    assert isinstance(row_a['value_sketch'], bytes)
+
+    row_b = result[result['id'] == 'B'].iloc[0]
+    assert row_b['p50_value'] == 45
+    assert row_b['distinct_active_days'] == 1
+
+def test_aggregate_and_enrich_sketches_match_exact():
+    rng = np.random.default_rng(0)
+    n = 20000
+    df = pd.DataFrame({
+        'id': rng.integers(0, 50, n).astype(str),
+        'date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 90, n), unit='D'),
+        'value': rng.exponential(20, n),
+    })
+    result = aggregate_and_enrich(df.copy(), sketches=True).set_index('id')
+    exact = df.groupby('id').agg(p50=('value', 'median'), days=('date', 'nunique'))
+
+    rank_error = (result['p50_value'] - exact['p50']).abs() / exact['p50']
+    assert rank_error.max() < 0.05
+    day_error = (result['distinct_active_days'] - exact['days']).abs() / exact['days']
+    assert day_error.max() < 3 * 1.04 / np.sqrt(2 ** 10)
+
+def test_merge_gold_sketches_combines_runs():
+    data = {
+        'id': ['A', 'A', 'B', 'A', 'B', 'C'],
+        'date': ['2025-07-01', '2025-07-02', '2025-07-01', '2025-07-02', '2025-07-05', '2025-07-03'],
+        'value': [10, 20, 30, 60, 50, 5]
+    }
+    df = pd.DataFrame(data)
+    full = aggregate_and_enrich(df.copy(), sketches=True).set_index('id')
+    first = aggregate_and_enrich(df.iloc[:3].copy(), sketches=True)
+    second = aggregate_and_enrich(df.iloc[3:].copy(), sketches=True)
+
+    merged = merge_gold_sketches([first, second]).set_index('id')
+    for col in ['total_count', 'sum_value', 'avg_value', 'last_date', 'p50_value', 'p95_value',
+                'distinct_active_days', 'high_value']:
+        assert merged[col].equals(full[col]), col
+
+def test_merge_gold_sketches_day_count_ignores_datetime_unit():
+    dates = pd.to_datetime(['2025-07-01 08:00', '2025-07-01 17:00'])
+    first = pd.DataFrame({'id': ['A'], 'date': dates[:1].as_unit('ns'), 'value': [1.0]})
+    second = pd.DataFrame({'id': ['A'], 'date': dates[1:].as_unit('s'), 'value': [2.0]})
+
+    merged = merge_gold_sketches([aggregate_and_enrich(first, sketches=True),
+                                  aggregate_and_enrich(second, sketches=True)])
+    assert merged['distinct_active_days'].tolist() == [1]
+
+def test_compute_trailing_windows_daily():
+    data = {
+        'id': ['A', 'A', 'A', 'A', 'B'],
+        'date': ['2025-07-01', '2025-07-01', '2025-07-05', '2025-07-09', '2025-07-09'],
+        'value': [10, 20, 30, 40, 50]
+    }
+    partials = compute_window_partials(pd.DataFrame(data), freq='D')
+    result = compute_trailing_windows(partials, windows=(7,), freq='D')
+
+    row_a = result[result['id'] == 'A'].set_index('bucket')
+    assert row_a.loc['2025-07-01', 'trailing_7d_sum_value'] == 30
+    assert row_a.loc['2025-07-05', 'trailing_7d_sum_value'] == 60
+    assert row_a.loc['2025-07-09', 'trailing_7d_count'] == 2  # 07-01 is outside (07-02, 07-09]
+    assert result[result['id'] == 'B']['trailing_7d_sum_value'].iloc[0] == 50
+
+def test_aggregate_windows_incremental_matches_full(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 3000
+    df = pd.DataFrame({
+        'id': rng.integers(0, 20, n).astype(str),
+        'date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 90, n), unit='D'),
+        'value': rng.exponential(20, n),
+    })
+    aggregate_windows(df.iloc[:1000], str(tmp_path / "incremental"), mode='add')
+    incremental = aggregate_windows(df.iloc[1000:], str(tmp_path / "incremental"), mode='add')
+    full = aggregate_windows(df, str(tmp_path / "full"))
+    rerun = aggregate_windows(df, str(tmp_path / "full"))
+
+    assert (tmp_path / "incremental" / "gold_windows_d.parquet").exists()
+    for col in ['count', 'trailing_7d_count', 'trailing_30d_count', 'trailing_30d_sum_value']:
+        assert np.allclose(incremental[col], full[col]), col
+        assert np.allclose(rerun[col], full[col]), col
+
+def test_merge_window_partials_replace_mode():
+    first = compute_window_partials(pd.DataFrame({
+        'id': ['A', 'A'], 'date': ['2025-07-01', '2025-07-02'], 'value': [10, 20]
+    }))
+    rerun = compute_window_partials(pd.DataFrame({
+        'id': ['A'], 'date': ['2025-07-02'], 'value': [25]
+    }))
+    replaced = merge_window_partials(first, rerun, mode='replace')
+    added = merge_window_partials(first, rerun, mode='add')
+    assert replaced['sum_value'].tolist() == [10, 25]
+    assert added['sum_value'].tolist() == [10, 45]
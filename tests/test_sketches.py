@@ -0,0 +1,63 @@
+# tests/test_sketches.py
+
+import numpy as np
+import pytest
+
+from src.sketches import HyperLogLog, QuantileSketch
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).normal(size=200_000)
+
+
+def test_quantile_sketch_within_error_bound(values):
+    sketch = QuantileSketch(k=200, seed=1)
+    for chunk in np.array_split(values, 7):
+        sketch.update(chunk)
+
+    sorted_values = np.sort(values)
+    for q in (0.05, 0.5, 0.95):
+        rank = np.searchsorted(sorted_values, sketch.quantile(q)) / len(values)
+        assert abs(rank - q) < 0.0165
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+
+def test_quantile_sketch_small_input_is_exact():
+    sketch = QuantileSketch(k=200).update([5, 1, None, 3, 2, 4])
+    assert sketch.n == 5
+    assert sketch.quantile(0.5) == 3
+
+
+def test_quantile_sketch_merge_and_roundtrip(values):
+    left = QuantileSketch(seed=1).update(values[:100_000])
+    right = QuantileSketch(seed=2).update(values[100_000:])
+    merged = left.merge(right)
+    assert merged.n == len(values)
+    assert abs(merged.quantile(0.5) - np.median(values)) < 0.05
+
+    restored = QuantileSketch.from_bytes(merged.to_bytes())
+    assert restored.quantile(0.5) == merged.quantile(0.5)
+    assert QuantileSketch.from_dict(merged.to_dict()).quantile(0.9) == merged.quantile(0.9)
+
+
+def test_hyperloglog_count_and_merge():
+    rng = np.random.default_rng(0)
+    left = rng.integers(0, 50_000, 200_000)
+    right = rng.integers(25_000, 75_000, 200_000)
+    exact = len(np.union1d(left, right))
+
+    hll = HyperLogLog(p=12).update(left).merge(HyperLogLog(p=12).update(right))
+    assert abs(hll.count() - exact) / exact < 3 * hll.relative_error
+    assert HyperLogLog.from_bytes(hll.to_bytes()).count() == hll.count()
+
+
+def test_hyperloglog_small_cardinality_and_nulls():
+    hll = HyperLogLog(p=10).update(['a', 'b', 'c', 'a', None])
+    assert round(hll.count()) == 3
+
+
+def test_hyperloglog_precision_mismatch_raises():
+    with pytest.raises(ValueError):
+        HyperLogLog(p=10).merge(HyperLogLog(p=12))
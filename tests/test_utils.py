@@ -1,6 +1,18 @@
 import os
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
-from src.utils import load_config
+from src.utils import (
+    RateLimitFilter,
+    get_log_queue,
+    init_worker_logging,
+    load_config,
+    setup_logging,
+    stop_logging,
+)
 
 
 def test_load_config_reads_yaml(tmp_path):
@@ -25,3 +37,87 @@ def test_load_config_env_override(monkeypatch, tmp_path):
 
     config = load_config(str(config_file))
     assert config["log_level"] == "DEBUG"
+
+
+def _log_from_worker(message):
+    logging.getLogger("worker").warning(message)
+
+
+def test_setup_logging_queued_writes_file(tmp_path):
+    """Test that queued logging delivers records to the file handler."""
+    log_file = tmp_path / "logs" / "pipeline.log"
+    listener = setup_logging(default_path="missing.yaml", log_file=str(log_file))
+    assert listener is not None
+
+    logging.getLogger("test_queued").warning("queued %s", "message")
+    stop_logging()
+    assert "queued message" in log_file.read_text()
+
+
+def test_setup_logging_level_overrides_yaml(tmp_path):
+    """Test that an explicit level applies even when the YAML sets its own."""
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(
+        "version: 1\n"
+        "handlers:\n  file: {class: logging.FileHandler, level: DEBUG, filename: unused.log}\n"
+        "loggers:\n  '': {level: INFO, handlers: [file]}\n  src.x: {level: DEBUG, handlers: [file], propagate: no}\n"
+    )
+    log_file = tmp_path / "pipeline.log"
+    setup_logging(default_path=str(config_file), default_level="WARNING", log_file=str(log_file))
+    for name in ["", "src.x"]:
+        logging.getLogger(name).info("quiet %s", name)
+        logging.getLogger(name).warning("loud %s", name)
+    stop_logging()
+
+    text = log_file.read_text()
+    assert "quiet" not in text
+    assert text.count("loud") == 2
+
+
+def test_setup_logging_json_format(tmp_path):
+    """Test that json_format renders one JSON object per line."""
+    log_file = tmp_path / "pipeline.log"
+    setup_logging(default_path="missing.yaml", log_file=str(log_file), json_format=True)
+    logging.getLogger("test_json").warning("file %s done", "a.csv", extra={"rows": 3})
+    stop_logging()
+
+    record = json.loads(log_file.read_text().splitlines()[-1])
+    assert record["message"] == "file a.csv done"
+    assert record["level"] == "WARNING"
+    assert record["rows"] == 3
+
+
+def test_rate_limit_filter_suppresses_repeats():
+    """Test that repeats of one template are dropped beyond the rate."""
+    limiter = RateLimitFilter(rate=2, per_seconds=60)
+    records = [
+        logging.makeLogRecord({"name": "x", "msg": "Ingested %s", "args": (i,), "levelno": logging.INFO})
+        for i in range(5)
+    ]
+    assert [limiter.filter(r) for r in records] == [True, True, False, False, False]
+
+    warning = logging.makeLogRecord({"name": "x", "msg": "Ingested %s", "args": (9,), "levelno": logging.WARNING})
+    assert limiter.filter(warning)
+
+
+def test_init_worker_logging_from_process(tmp_path):
+    """Test that worker processes log through the parent's listener."""
+    log_file = tmp_path / "pipeline.log"
+    setup_logging(default_path="missing.yaml", log_file=str(log_file), multiprocess=True)
+    with ProcessPoolExecutor(
+        max_workers=1, initializer=init_worker_logging, initargs=(get_log_queue(),)
+    ) as pool:
+        pool.submit(_log_from_worker, "hello from worker").result()
+    stop_logging()
+    assert "hello from worker" in log_file.read_text()
+
+
+@pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="needs fork")
+def test_forked_worker_logs_without_multiprocess_queue(tmp_path):
+    """Test that a forked worker writes directly instead of to an undrained queue."""
+    log_file = tmp_path / "pipeline.log"
+    setup_logging(default_path="missing.yaml", log_file=str(log_file))
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as pool:
+        pool.submit(_log_from_worker, "hello from forked worker").result()
+    stop_logging()
+    assert "hello from forked worker" in log_file.read_text()
@@ -2,7 +2,14 @@
 
 import pandas as pd
 import pytest
-from src.visualization import plot_correlation_heatmap, plot_time_series, plot_null_values, plot_histogram
+from src.profiling import profile_dataframe
+from src.visualization import (
+    generate_visualizations,
+    plot_correlation_heatmap,
+    plot_histogram,
+    plot_null_values,
+    plot_time_series,
+)
 
 @pytest.fixture
 def sample_df():
@@ -37,3 +44,9 @@ def test_plot_histogram(tmp_path, sample_df):
     plot_histogram(sample_df, 'value1', save_path=str(save_path))
     assert save_path.exists()
     assert save_path.stat().st_size > 0
+
+def test_generate_visualizations_from_profile(tmp_path, sample_df):
+    profile = profile_dataframe(sample_df)
+    generate_visualizations(sample_df, output_dir=str(tmp_path), profile=profile)
+    for name in ("correlation_heatmap.png", "null_values.png", "histogram.png", "time_series.png"):
+        assert (tmp_path / name).stat().st_size > 0